@@ -3,24 +3,44 @@ from typing import List, Optional
 import numpy as np
 import numpy.typing as npt
 
-# Type Alias for clarity
-Vector3D = npt.NDArray[np.float64]  # Shape (N, 3)
+# Type Alias for clarity. Physics state is kept in float32: the
+# simulation is for visualization, and single precision halves memory
+# bandwidth on every stencil/distance pass.
+Vector3D = npt.NDArray[np.float32]  # Shape (N, 3)
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """Immutable configuration for a simulation."""
     time_step: float = 0.01
     resolution: int = 100  # Number of points or matrix size N
-    coupling_constant: float = 1.0  # g_s or tension
+    coupling_constant: float = 1.0  # Initial g_s or tension (live value in RuntimeParams)
     splitting_enabled: bool = True  # Enable string splitting/joining
     splitting_probability: float = 0.3  # Probability of split when intersection detected
 
+@dataclass(slots=True)
+class RuntimeParams:
+    """Mutable parameters tweakable from the UI while a simulation runs."""
+    coupling_constant: float = 1.0  # g_s or tension
+    mass: float = 1.0  # Confinement (BFSS)
+
 @dataclass(slots=True)
 class StringLoop:
     """A single closed string loop."""
     positions: Vector3D  # (N, 3)
     velocities: Vector3D  # (N, 3)
     color_id: int = 0  # For visual distinction after splits
+    # Acceleration carried across Verlet steps (one force evaluation per
+    # step instead of two); None until the first integration
+    acc: Optional[Vector3D] = None
+
+    def copy(self) -> "StringLoop":
+        """Deep snapshot with freshly-owned (writable) arrays."""
+        return StringLoop(
+            positions=self.positions.copy(),
+            velocities=self.velocities.copy(),
+            color_id=self.color_id,
+            acc=None if self.acc is None else self.acc.copy(),
+        )
 
 @dataclass(slots=True)
 class StringState:
@@ -33,12 +53,41 @@ class StringState:
     loops: Optional[List[StringLoop]] = None  # All string loops
     num_loops: int = 1  # Number of active loops
 
+    def copy(self) -> "StringState":
+        """
+        Deep snapshot of the state. Engine get_state hands out live views
+        into buffers that later steps mutate in place; call this to keep
+        a frame (e.g. when collecting a sequence for batch playback).
+        """
+        return StringState(
+            positions=self.positions.copy(),
+            velocities=self.velocities.copy(),
+            energy=self.energy,
+            loops=None if self.loops is None else [l.copy() for l in self.loops],
+            num_loops=self.num_loops,
+        )
+
 @dataclass(slots=True)
 class MatrixState:
     """Instantaneous state of the BFSS model (D0-branes)."""
-    # 9 bosonic matrices X_I of size (N, N)
-    matrices: List[npt.NDArray[np.complex128]] 
     eigenvalues: Vector3D # For rendering (point cloud)
     # Off-diagonal coupling strengths for emergent geometry
     # Shape (N, N) - connection_strength[i,j] = how strongly brane i and j are connected
     connection_strengths: Optional[npt.NDArray[np.float64]] = None
+    # Bosonic matrices as one contiguous (3, N, N) complex64 stack (SoA:
+    # single aligned allocation, batched einsum/eigvalsh friendly).
+    # Only populated when the engine's debug_state flag is set - copying
+    # them every frame is pure allocator churn the renderer never reads.
+    matrices: Optional[npt.NDArray[np.complex64]] = None
+
+    @property
+    def x(self) -> Optional[npt.NDArray[np.complex64]]:
+        return None if self.matrices is None else self.matrices[0]
+
+    @property
+    def y(self) -> Optional[npt.NDArray[np.complex64]]:
+        return None if self.matrices is None else self.matrices[1]
+
+    @property
+    def z(self) -> Optional[npt.NDArray[np.complex64]]:
+        return None if self.matrices is None else self.matrices[2]
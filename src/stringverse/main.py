@@ -16,6 +16,10 @@ from stringverse.visualization.matrix_renderer import MatrixRenderer
 from stringverse.visualization.calabi_renderer import CalabiYauRenderer
 
 class MainController:
+    # Fixed-step physics: never advance more than this many steps per
+    # rendered frame (avoids the spiral of death when rendering stalls)
+    MAX_PHYSICS_STEPS = 4
+
     def __init__(self, interactive: bool = True):
         self.config = SimulationConfig(
             time_step=0.05, 
@@ -36,8 +40,10 @@ class MainController:
         self.current_mode = "1"
         self.physics: PhysicsEngine | None = None
         self.renderer: Renderer | None = None
-        
+
         self.is_running = True
+        self.accumulator = 0.0  # Unsimulated time carried between frames
+        self._pending_switch: str | None = None
 
     def switch_module(self, mode_key: str):
         if mode_key not in self.modules:
@@ -59,6 +65,7 @@ class MainController:
             self.physics.initialize(self.config)
         else:
             self.physics = None
+        self.accumulator = 0.0
             
         # We need to preserve the plotter window if possible, 
         # but Renderers currently create their own Plotter in __init__.
@@ -80,7 +87,12 @@ class MainController:
         # We need to close the old plotter window.
         
         if self.renderer:
-            self.renderer.plotter.close()
+            # Renderers holding extra resources (e.g. StringRenderer's
+            # thread pool) expose close(); others just need the window gone
+            if hasattr(self.renderer, 'close'):
+                self.renderer.close()
+            else:
+                self.renderer.plotter.close()
             
         self.renderer = RendererCls(interactive=self.interactive)
         self.renderer.setup_scene()
@@ -108,13 +120,15 @@ class MainController:
         # Sliders
         # We need to update self.config
         
+        # SimulationConfig is frozen; live tweaks go through the engine's
+        # mutable RuntimeParams instead
         def update_coupling(value):
-            self.config.coupling_constant = value
-            
+            if self.physics is not None:
+                self.physics.params.coupling_constant = value
+
         def update_mass(value):
-            # Hack: access physics engine directly if it has mass
-            if hasattr(self.physics, 'mass'):
-                self.physics.mass = value
+            if self.physics is not None:
+                self.physics.params.mass = value
 
         plotter.add_slider_widget(
             update_coupling,
@@ -153,23 +167,41 @@ class MainController:
     def run(self):
         # Initial setup
         self._pending_switch = self.current_mode
-        
+        last_time = time.perf_counter()
+
         # Main Loop
         while self.is_running:
             # Handle Scene Switching
-            if hasattr(self, '_pending_switch') and self._pending_switch:
+            if self._pending_switch:
                 mode = self._pending_switch
                 self._pending_switch = None
                 self.switch_module(mode)
             
             # Simulation Loop
             if self.renderer:
+                # Hoist the per-frame attribute chain
+                plotter = self.renderer.plotter
                 try:
-                    start_time = time.time()
-                    
-                    # Physics Step
+                    start_time = time.perf_counter()
+                    frame_dt = min(start_time - last_time, 0.25)
+                    last_time = start_time
+
+                    # Fixed-step physics, decoupled from render cadence:
+                    # consume the elapsed wall time in time_step quanta,
+                    # then render the resulting state once
                     if self.physics:
-                        self.physics.step(self.config.time_step)
+                        self.accumulator += frame_dt
+                        steps = 0
+                        while (self.accumulator >= self.config.time_step
+                               and steps < self.MAX_PHYSICS_STEPS):
+                            self.physics.step(self.config.time_step)
+                            self.accumulator -= self.config.time_step
+                            steps += 1
+                        # Drop any backlog the step cap didn't drain:
+                        # under sustained overload the accumulator would
+                        # otherwise grow without bound and fast-forward
+                        # the sim once load drops
+                        self.accumulator = min(self.accumulator, self.config.time_step)
                         state = self.physics.get_state()
                         self.renderer.update_actors(state)
                     else:
@@ -177,18 +209,22 @@ class MainController:
                         self.renderer.update_actors(None)
                     
                     # Render
-                    self.renderer.plotter.update()
-                    
-                    # Check close
-                    if getattr(self.renderer.plotter, 'closed', False):
+                    plotter.update()
+
+                    # Check close (private flag, but pyvista exposes no
+                    # public equivalent)
+                    if plotter._closed:
                         self.is_running = False
                         break
-                        
-                    # Pacing
-                    elapsed = time.time() - start_time
-                    target = 1.0 / 60.0
-                    if elapsed < target:
-                        time.sleep(target - elapsed)
+
+                    # Pacing: monotonic deadline, and keep pumping VTK
+                    # events during the slack instead of one blocking sleep
+                    # (a long sleep starves the interactor and makes the
+                    # window appear unresponsive)
+                    deadline = start_time + 1.0 / 60.0
+                    while time.perf_counter() < deadline:
+                        plotter.update()
+                        time.sleep(0.001)
                         
                 except KeyboardInterrupt:
                     print("Stopped.")
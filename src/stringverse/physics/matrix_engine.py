@@ -7,7 +7,7 @@ Target: N=100+ at 60 FPS for visible emergent geometry.
 import numpy as np
 import numpy.typing as npt
 from typing import List
-from stringverse.core.models import SimulationConfig, MatrixState
+from stringverse.core.models import SimulationConfig, RuntimeParams, MatrixState
 from stringverse.core.interfaces import PhysicsEngine
 
 # Try to import CuPy for GPU acceleration
@@ -20,6 +20,71 @@ except ImportError:
     GPU_AVAILABLE = False
     print("⚠️  CuPy not found. Using CPU (NumPy). Install cupy for GPU acceleration.")
 
+# Try to import Numba for JIT-compiled CPU fallback
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _compute_forces_numba(X, mass, coupling, out):
+        """
+        Compiled CPU force kernel. For small N the Python dispatch overhead
+        per matmul dominates the BLAS work; Numba collapses it into one
+        compiled loop (commutators once, then the 3 forces in parallel).
+        """
+        n = X.shape[1]
+        comm = np.empty((3, n, n), dtype=X.dtype)
+        p01 = X[0] @ X[1]
+        comm[0] = p01 - p01.conj().T
+        p02 = X[0] @ X[2]
+        comm[1] = p02 - p02.conj().T
+        p12 = X[1] @ X[2]
+        comm[2] = p12 - p12.conj().T
+
+        for i in prange(3):
+            acc = np.zeros((n, n), dtype=X.dtype)
+            for j in range(3):
+                if j == i:
+                    continue
+                # Pair (min(i,j), max(i,j)) maps to commutator index i+j-1
+                c = comm[i + j - 1]
+                if i < j:
+                    acc += X[j] @ c - c @ X[j]
+                else:
+                    acc += c @ X[j] - X[j] @ c
+            out[i] = coupling * acc - mass * X[i]
+
+
+if GPU_AVAILABLE:
+    # Fused Velocity-Verlet half-step: one kernel launch instead of the
+    # add / scale / position-update / clip chain, so the (3,N,N) state
+    # tensor moves through global memory once per half-step.
+    _verlet_half_kernel = cp.ElementwiseKernel(
+        'complex64 f, complex64 v, complex64 x, float64 dt, float64 damping, float64 clip_val',
+        'complex64 v_out, complex64 x_out',
+        '''
+        complex<float> vn = ((float)(0.5 * dt) * f + v) * (float)(1.0 - damping);
+        complex<float> xn = x + (float)dt * vn;
+        float re = min(max(xn.real(), (float)-clip_val), (float)clip_val);
+        float im = min(max(xn.imag(), (float)-clip_val), (float)clip_val);
+        v_out = vn;
+        x_out = complex<float>(re, im);
+        ''',
+        'verlet_half')
+
+    # Second half-step only kicks the velocities
+    _verlet_kick_kernel = cp.ElementwiseKernel(
+        'complex64 f, complex64 v, float64 dt, float64 damping',
+        'complex64 v_out',
+        'v_out = ((float)(0.5 * dt) * f + v) * (float)(1.0 - damping);',
+        'verlet_kick')
+
 
 class BFSSMatrixModel(PhysicsEngine):
     """
@@ -35,12 +100,14 @@ class BFSSMatrixModel(PhysicsEngine):
     def __init__(self) -> None:
         self.config: SimulationConfig | None = None
         self.n_size: int = 0
-        self.mass: float = 1.0
+        self.params = RuntimeParams()  # UI-tweakable coupling/mass
         self.damping: float = 0.01
         self.base_damping: float = 0.01
         self.afterburn_damping: float = 0.15
         self.afterburn_timer: float = 0.0
         self.max_value: float = 50.0
+        self.debug_state: bool = False  # Include raw matrices in get_state()
+        self.eig_interval: int = 2  # Solve eigvalsh every K frames, interpolate between
         
         # GPU or CPU array library
         self.xp = cp if GPU_AVAILABLE else np
@@ -52,7 +119,10 @@ class BFSSMatrixModel(PhysicsEngine):
 
     def initialize(self, config: SimulationConfig) -> None:
         self.config = config
-        
+        # Seed the live parameters from the config (and reset any stale
+        # slider values from a previous run)
+        self.params = RuntimeParams(coupling_constant=config.coupling_constant)
+
         # With GPU, we can handle larger N
         if self.use_gpu:
             self.n_size = min(config.resolution, 128)  # GPU can handle 128
@@ -60,51 +130,120 @@ class BFSSMatrixModel(PhysicsEngine):
             self.n_size = min(config.resolution, 32)   # CPU limited to 32
         
         xp = self.xp
-        
+
         # Initialize random Hermitian matrices on GPU/CPU
-        self._matrices = xp.zeros((3, self.n_size, self.n_size), dtype=xp.complex128)
-        self._velocities = xp.zeros((3, self.n_size, self.n_size), dtype=xp.complex128)
-        
+        # Single precision: visualization doesn't need double, and complex64
+        # halves memory traffic and roughly doubles GEMM throughput.
+        self._matrices = xp.zeros((3, self.n_size, self.n_size), dtype=xp.complex64)
+        self._velocities = xp.zeros((3, self.n_size, self.n_size), dtype=xp.complex64)
+
         for i in range(3):
             # Random complex matrix
             A = xp.random.randn(self.n_size, self.n_size) + 1j * xp.random.randn(self.n_size, self.n_size)
             # Make Hermitian: X = (A + A†) / 2
             self._matrices[i] = (A + xp.conj(A.T)) * 0.1
-            
+
             # Initial velocities (thermal)
             V = xp.random.randn(self.n_size, self.n_size) + 1j * xp.random.randn(self.n_size, self.n_size)
             self._velocities[i] = (V + xp.conj(V.T)) * 0.01
-        
+
+        # Scratch buffers for _compute_forces - allocated once so the
+        # hot path does zero allocations per call
+        shape = (self.n_size, self.n_size)
+        self._pair_a = xp.empty((3,) + shape, dtype=xp.complex64)
+        self._pair_b = xp.empty_like(self._pair_a)
+        self._prod = xp.empty_like(self._pair_a)
+        self._prod_h = xp.empty_like(self._pair_a)
+        self._jstack = xp.empty((6,) + shape, dtype=xp.complex64)
+        self._cstack = xp.empty_like(self._jstack)
+        self._jc = xp.empty_like(self._jstack)
+        self._jc_h = xp.empty_like(self._jstack)
+        self._forces = xp.empty((3,) + shape, dtype=xp.complex64)
+
+        # Eigenvalue memoization state (see _interpolated_eigenvalues):
+        # two owned (N,3) buffers for prev/cur solves plus one for the
+        # interpolated output, so the per-frame path never allocates
+        self._eig_frame = 0
+        self._prev_eigs = None
+        self._cur_eigs = None
+        self._eig_bufs = [np.empty((self.n_size, 3), dtype=np.float64) for _ in range(2)]
+        self._points = np.empty((self.n_size, 3), dtype=np.float64)
+
+        # Small ring of reusable MatrixState slots: get_state fills the
+        # next slot in place instead of allocating a state per frame
+        self._state_pool = [
+            MatrixState(
+                eigenvalues=np.empty((self.n_size, 3), dtype=np.float64),
+                connection_strengths=np.empty((self.n_size, self.n_size), dtype=np.float32),
+            )
+            for _ in range(2)
+        ]
+        self._state_idx = 0
+
+        # Persistent transfer stream + pinned host staging buffer: device
+        # to host copies go through page-locked memory asynchronously
+        # instead of allocating a pageable buffer per transfer
+        if self.use_gpu:
+            n_elems = 3 * self.n_size * self.n_size
+            self._copy_stream = cp.cuda.Stream(non_blocking=True)
+            self._pinned_mem = cp.cuda.alloc_pinned_memory(n_elems * 8)  # complex64
+            self._host_matrices = np.frombuffer(
+                self._pinned_mem, dtype=np.complex64, count=n_elems
+            ).reshape(3, self.n_size, self.n_size)
+
         print(f"{'🚀 GPU' if self.use_gpu else '🐢 CPU'} Matrix Model initialized with N={self.n_size}")
 
-    def _compute_forces_gpu(self, X):
+    def _compute_forces(self, X):
         """
-        Vectorized force computation optimized for GPU.
-        Uses batch operations instead of loops where possible.
+        Vectorized force computation optimized for GPU and CPU.
+
+        All pairwise products X_i @ X_j are computed in a single batched
+        matmul (one fused ZGEMM call) instead of many small `@` dispatches.
         """
         xp = self.xp
-        coupling = self.config.coupling_constant
-        forces = xp.zeros_like(X)
-        
-        # Precompute all commutators [X_i, X_j] for i < j
-        # comm[0] = [X0, X1], comm[1] = [X0, X2], comm[2] = [X1, X2]
-        comm_01 = X[0] @ X[1] - X[1] @ X[0]
-        comm_02 = X[0] @ X[2] - X[2] @ X[0]
-        comm_12 = X[1] @ X[2] - X[2] @ X[1]
-        
-        # Force on X[0]: [X1, [X0,X1]] + [X2, [X0,X2]]
-        forces[0] = (X[1] @ comm_01 - comm_01 @ X[1]) + (X[2] @ comm_02 - comm_02 @ X[2])
-        
-        # Force on X[1]: [X0, [X1,X0]] + [X2, [X1,X2]]
-        # Note: [X1,X0] = -[X0,X1]
-        forces[1] = (X[0] @ (-comm_01) - (-comm_01) @ X[0]) + (X[2] @ comm_12 - comm_12 @ X[2])
-        
-        # Force on X[2]: [X0, [X2,X0]] + [X1, [X2,X1]]
-        forces[2] = (X[0] @ (-comm_02) - (-comm_02) @ X[0]) + (X[1] @ (-comm_12) - (-comm_12) @ X[1])
-        
-        # Apply coupling and mass term
-        forces = coupling * forces - self.mass * X
-        
+        coupling = self.params.coupling_constant
+        mass = self.params.mass
+
+        # CPU: hand the whole computation to the compiled kernel
+        if not self.use_gpu and NUMBA_AVAILABLE:
+            _compute_forces_numba(X, mass, coupling, self._forces)
+            return self._forces
+
+        # Only the 3 unique products X_i @ X_j (i < j) in one batched call;
+        # for Hermitian X, X_j @ X_i = (X_i @ X_j)† so the commutator
+        # [X_i, X_j] = P - P† is anti-Hermitian and the lower triangle is free.
+        # All intermediates go through preallocated scratch buffers.
+        A, B = self._pair_a, self._pair_b
+        A[0] = X[0]; A[1] = X[0]; A[2] = X[1]
+        B[0] = X[1]; B[1] = X[2]; B[2] = X[2]
+        P = xp.matmul(A, B, out=self._prod)
+        xp.conjugate(P.transpose(0, 2, 1), out=self._prod_h)
+        C = xp.subtract(P, self._prod_h, out=self._prod_h)
+        comm_01, comm_02, comm_12 = C
+
+        # Force terms [X_j, [X_i, X_j]]: with C anti-Hermitian and X_j
+        # Hermitian, X_j @ C - C @ X_j = X_j @ C + (X_j @ C)†, so one GEMM
+        # per pair. Pair order: (force index, j) = (0,1),(0,2),(1,0),(1,2),(2,0),(2,1)
+        J = self._jstack
+        J[0] = X[1]; J[1] = X[2]; J[2] = X[0]; J[3] = X[2]; J[4] = X[0]; J[5] = X[1]
+        Cs = self._cstack
+        Cs[0] = comm_01; Cs[1] = comm_02; Cs[3] = comm_12
+        xp.negative(comm_01, out=Cs[2])
+        xp.negative(comm_02, out=Cs[4])
+        xp.negative(comm_12, out=Cs[5])
+        JC = xp.matmul(J, Cs, out=self._jc)
+        xp.conjugate(JC.transpose(0, 2, 1), out=self._jc_h)
+        T = xp.add(JC, self._jc_h, out=self._jc)
+
+        # Sum the two contributions per force, apply coupling and mass term
+        forces = self._forces
+        xp.add(T[0], T[1], out=forces[0])
+        xp.add(T[2], T[3], out=forces[1])
+        xp.add(T[4], T[5], out=forces[2])
+        forces *= coupling
+        mass_term = xp.multiply(X, mass, out=self._prod)  # scratch reuse
+        forces -= mass_term
+
         return forces
 
     def step(self, dt: float) -> None:
@@ -121,18 +260,37 @@ class BFSSMatrixModel(PhysicsEngine):
         else:
             self.damping = self.base_damping
 
-        # Velocity Verlet integration (GPU-optimized)
-        forces = self._compute_forces_gpu(self._matrices)
-        self._velocities += 0.5 * forces * dt
-        self._velocities *= (1.0 - self.damping)
-        self._matrices += self._velocities * dt
-        
-        # Clamp to prevent overflow
-        self._matrices = xp.clip(self._matrices, -self.max_value, self.max_value)
-        
-        forces_new = self._compute_forces_gpu(self._matrices)
-        self._velocities += 0.5 * forces_new * dt
-        self._velocities *= (1.0 - self.damping)
+        # Velocity Verlet integration
+        forces = self._compute_forces(self._matrices)
+        if self.use_gpu:
+            # Fused kernels: one launch per half-step instead of 4-5
+            _verlet_half_kernel(forces, self._velocities, self._matrices,
+                                dt, self.damping, self.max_value,
+                                self._velocities, self._matrices)
+            forces_new = self._compute_forces(self._matrices)
+            _verlet_kick_kernel(forces_new, self._velocities, dt, self.damping,
+                                self._velocities)
+        else:
+            self._velocities += 0.5 * forces * dt
+            self._velocities *= (1.0 - self.damping)
+            self._matrices += self._velocities * dt
+
+            # Clamp to prevent overflow - in place on the real/imag views,
+            # no fresh (3,N,N) allocation per step
+            xp.clip(self._matrices.real, -self.max_value, self.max_value, out=self._matrices.real)
+            xp.clip(self._matrices.imag, -self.max_value, self.max_value, out=self._matrices.imag)
+
+            forces_new = self._compute_forces(self._matrices)
+            self._velocities += 0.5 * forces_new * dt
+            self._velocities *= (1.0 - self.damping)
+
+        # Re-Hermitize to remove round-off drift (keeps eigvalsh valid) -
+        # symmetrized in place via the force scratch, so the stacks keep
+        # their identity and no fresh (3, N, N) temporaries appear
+        for stack in (self._matrices, self._velocities):
+            xp.conjugate(stack.transpose(0, 2, 1), out=self._prod_h)
+            stack += self._prod_h
+            stack *= 0.5
 
     def poke(self, strength: float = 5.0) -> None:
         """Explosive perturbation with after-burn effect."""
@@ -140,14 +298,77 @@ class BFSSMatrixModel(PhysicsEngine):
             return
         
         xp = self.xp
-        
+
         for i in range(3):
-            V = xp.random.randn(self.n_size, self.n_size) + 1j * xp.random.randn(self.n_size, self.n_size)
-            self._velocities[i] += (V + xp.conj(V.T)) * strength
+            # Rank-2 Hermitian kick u v† + v u†: same explosive character
+            # as a dense random Hermitian matrix for 4N draws instead of 2N²
+            u = xp.random.randn(self.n_size) + 1j * xp.random.randn(self.n_size)
+            v = xp.random.randn(self.n_size) + 1j * xp.random.randn(self.n_size)
+            self._velocities[i] += (strength * (xp.outer(u, v.conj()) + xp.outer(v, u.conj()))).astype(xp.complex64)
         
         self.afterburn_timer = 2.0
         self.damping = self.afterburn_damping
 
+    def _compute_eigenvalues(self, out: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Solve the three Hermitian eigenproblems into `out` (N, 3)."""
+        if self.use_gpu:
+            # One batched solve over the (3,N,N) stack (cuSOLVER's batched
+            # driver - much better utilization than three serial launches
+            # at this matrix size), transferring only the (3,N) result.
+            try:
+                eigs = cp.sort(cp.linalg.eigvalsh(self._matrices).real, axis=1)
+            except cp.linalg.LinAlgError:
+                eigs = cp.sort(cp.diagonal(self._matrices, axis1=1, axis2=2).real, axis=1)
+            out[:] = cp.asnumpy(eigs).T
+            return out
+
+        # One batched eigvalsh over the (3,N,N) stack instead of three
+        # serial calls; step() keeps the matrices exactly Hermitian so
+        # the solver input needs no extra symmetrization.
+        try:
+            eigs = np.linalg.eigvalsh(self._matrices)  # shape (3, N)
+        except np.linalg.LinAlgError:
+            eigs = np.real(np.diagonal(self._matrices, axis1=1, axis2=2)).copy()
+
+        # Sort for consistent visualization (eigvalsh already returns
+        # ascending order, but the diagonal fallback does not)
+        eigs.sort(axis=1)
+
+        out[:] = eigs.T
+        return out
+
+    def _interpolated_eigenvalues(self) -> npt.NDArray[np.float64]:
+        """
+        Eigenvalues for rendering, recomputed only every eig_interval
+        frames. The O(N^3) solve dominates get_state at N=128, and the
+        spectrum moves slowly relative to dt, so intermediate frames
+        linearly interpolate the last two solves.
+        """
+        offset = self._eig_frame % self.eig_interval
+        self._eig_frame += 1
+
+        if self._cur_eigs is None:
+            # First call: both slots point at the same freshly solved buffer
+            self._cur_eigs = self._compute_eigenvalues(self._eig_bufs[0])
+            self._prev_eigs = self._cur_eigs
+        elif offset == 0:
+            # Recycle the buffer not holding the current solve
+            spare = self._eig_bufs[0] if self._cur_eigs is self._eig_bufs[1] else self._eig_bufs[1]
+            self._prev_eigs = self._cur_eigs
+            self._cur_eigs = self._compute_eigenvalues(spare)
+
+        alpha = offset / self.eig_interval
+        if alpha == 0.0:
+            return self._prev_eigs
+
+        # prev + alpha * (cur - prev), entirely in the reused output buffer
+        points = self._points
+        points[:] = self._cur_eigs
+        points -= self._prev_eigs
+        points *= alpha
+        points += self._prev_eigs
+        return points
+
     def get_state(self) -> MatrixState:
         """
         Extract visualization state.
@@ -156,47 +377,47 @@ class BFSSMatrixModel(PhysicsEngine):
         if self._matrices is None:
             raise RuntimeError("Physics engine not initialized")
         
-        xp = self.xp
-        
-        # Transfer to CPU if on GPU
+        points = self._interpolated_eigenvalues()
+
+        # Reuse the next preallocated state slot instead of allocating a
+        # fresh MatrixState + arrays every frame
+        state = self._state_pool[self._state_idx]
+        self._state_idx = (self._state_idx + 1) % len(self._state_pool)
+        state.eigenvalues[:] = points
+
         if self.use_gpu:
-            matrices_cpu = cp.asnumpy(self._matrices)
+            connection_strengths = cp.einsum(
+                'kij,kij->ij', self._matrices.conj(), self._matrices).real
+            cp.fill_diagonal(connection_strengths, 0)
+
+            max_strength = cp.max(connection_strengths)
+            if max_strength > 0:
+                connection_strengths /= max_strength
+            cp.asnumpy(connection_strengths, out=state.connection_strengths)
+
+            if self.debug_state:
+                # Async copy into the pinned staging buffer on the
+                # dedicated transfer stream, overlapping compute
+                self._matrices.get(out=self._host_matrices, stream=self._copy_stream)
+                self._copy_stream.synchronize()
+                matrices_cpu = self._host_matrices
+            else:
+                matrices_cpu = None
         else:
             matrices_cpu = self._matrices
-        
-        # Eigenvalue computation (on CPU - NumPy's eigvalsh is fast enough)
-        try:
-            x_eig = np.real(np.linalg.eigvalsh(matrices_cpu[0]))
-            y_eig = np.real(np.linalg.eigvalsh(matrices_cpu[1]))
-            z_eig = np.real(np.linalg.eigvalsh(matrices_cpu[2]))
-        except np.linalg.LinAlgError:
-            x_eig = np.real(np.diagonal(matrices_cpu[0]))
-            y_eig = np.real(np.diagonal(matrices_cpu[1]))
-            z_eig = np.real(np.diagonal(matrices_cpu[2]))
-        
-        # Sort for consistent visualization
-        x_eig = np.sort(x_eig)
-        y_eig = np.sort(y_eig)
-        z_eig = np.sort(z_eig)
-        
-        points = np.column_stack((x_eig, y_eig, z_eig))
-        
-        # Connection strengths from off-diagonal elements
-        connection_strengths = np.zeros((self.n_size, self.n_size), dtype=np.float64)
-        for k in range(3):
-            connection_strengths += np.abs(matrices_cpu[k]) ** 2
-        
-        np.fill_diagonal(connection_strengths, 0)
-        
-        max_strength = np.max(connection_strengths)
-        if max_strength > 0:
-            connection_strengths /= max_strength
-        
-        return MatrixState(
-            matrices=[m.copy() for m in matrices_cpu],
-            eigenvalues=points,
-            connection_strengths=connection_strengths
-        )
+
+            # Connection strengths from off-diagonal elements: |M_kij|^2
+            # summed over k in a single pass, no abs/pow temporaries
+            conn = state.connection_strengths
+            conn[:] = np.einsum('kij,kij->ij', matrices_cpu.conj(), matrices_cpu).real
+            np.fill_diagonal(conn, 0)
+
+            max_strength = np.max(conn)
+            if max_strength > 0:
+                conn /= max_strength
+
+        state.matrices = matrices_cpu.copy() if self.debug_state and matrices_cpu is not None else None
+        return state
     
     # Property accessors for compatibility
     @property
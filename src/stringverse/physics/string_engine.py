@@ -7,13 +7,18 @@ Implements the Nambu-Goto action with:
 - String splitting (topology change)
 - Dynamic resampling for numerical stability
 """
+import logging
+
 import numpy as np
 import numpy.typing as npt
 from typing import List, Optional, Tuple
-from scipy.spatial.distance import cdist
-from scipy.interpolate import interp1d
-from stringverse.core.models import SimulationConfig, StringState, StringLoop
+from scipy.spatial import cKDTree
+from scipy.interpolate import CubicSpline
+from stringverse.core.models import SimulationConfig, RuntimeParams, StringState, StringLoop
 from stringverse.core.interfaces import PhysicsEngine
+from stringverse.utils import _jit
+
+logger = logging.getLogger(__name__)
 
 
 class RelativisticString(PhysicsEngine):
@@ -36,16 +41,30 @@ class RelativisticString(PhysicsEngine):
 
     def __init__(self) -> None:
         self.config: SimulationConfig | None = None
+        self.params = RuntimeParams()  # UI-tweakable tension
         self.loops: List[StringLoop] = []
         self.next_color_id: int = 0
         self.total_splits: int = 0
+        self._acc_bufs: dict[int, npt.NDArray[np.float32]] = {}  # keyed by loop size
+        # Batched SoA state (Numba path): all loops concatenated into one
+        # (Ntot, 3) block per field, delimited by _offsets. Loop objects
+        # hold views into these blocks; rebuilt when topology changes.
+        self._pos_all: npt.NDArray[np.float32] | None = None
+        self._vel_all: npt.NDArray[np.float32] | None = None
+        self._acc_all: npt.NDArray[np.float32] | None = None
+        self._offsets: npt.NDArray[np.int64] | None = None
+        self._batch_dirty = True
+        self._rng = np.random.default_rng()
 
     def initialize(self, config: SimulationConfig) -> None:
         """Initialize with a single perturbed string loop."""
         self.config = config
+        self.params = RuntimeParams(coupling_constant=config.coupling_constant)
         self.loops = []
         self.next_color_id = 0
         self.total_splits = 0
+        self._acc_bufs = {}
+        self._batch_dirty = True
         
         # Create initial loop
         initial_loop = self._create_initial_loop(config.resolution)
@@ -55,107 +74,168 @@ class RelativisticString(PhysicsEngine):
         """Create a perturbed circular string with traveling waves."""
         theta = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
         radius = 5.0
-        
-        positions = np.zeros((num_points, 3), dtype=np.float64)
-        positions[:, 0] = radius * np.cos(theta)
-        positions[:, 1] = radius * np.sin(theta)
-        
+
+        # One sin/cos pass; the mode-2 and mode-3 harmonics follow from
+        # the angle-addition identities instead of four more libm sweeps
+        c1 = np.cos(theta)
+        s1 = np.sin(theta)
+        c2 = 2.0 * c1 * c1 - 1.0
+        s2 = 2.0 * s1 * c1
+        c3 = (4.0 * c1 * c1 - 3.0) * c1
+        s3 = (3.0 - 4.0 * s1 * s1) * s1
+
+        positions = np.zeros((num_points, 3), dtype=np.float32)
+        positions[:, 0] = radius * c1
+        positions[:, 1] = radius * s1
+
         # Figure-8 like perturbation to encourage self-crossing
         # z = A * sin(2θ) creates two lobes that can overlap
-        positions[:, 2] = 3.0 * np.sin(2 * theta) + 1.5 * np.cos(3 * theta)
-        
+        positions[:, 2] = 3.0 * s2 + 1.5 * c3
+
         # Strong radial perturbation (pinches the loop)
-        radial_perturb = 1.5 * np.cos(2 * theta)  # Mode-2 = figure-8
-        positions[:, 0] += radial_perturb * np.cos(theta)
-        positions[:, 1] += radial_perturb * np.sin(theta)
+        radial_perturb = 1.5 * c2  # Mode-2 = figure-8
+        positions[:, 0] += radial_perturb * c1
+        positions[:, 1] += radial_perturb * s1
 
         # Traveling wave velocities to drive crossing
-        velocities = np.zeros((num_points, 3), dtype=np.float64)
-        velocities[:, 2] = 4.0 * np.cos(2 * theta)  # Phase shifted from position
-        velocities[:, 0] = 1.0 * np.sin(3 * theta)
-        velocities[:, 1] = 1.0 * np.cos(3 * theta)
+        velocities = np.zeros((num_points, 3), dtype=np.float32)
+        velocities[:, 2] = 4.0 * c2  # Phase shifted from position
+        velocities[:, 0] = 1.0 * s3
+        velocities[:, 1] = 1.0 * c3
         
         color_id = self.next_color_id
         self.next_color_id += 1
         
         return StringLoop(positions=positions, velocities=velocities, color_id=color_id)
 
-    def _compute_acceleration(self, positions: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    def _compute_acceleration(self, positions: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
         """Compute wave equation acceleration for a single loop."""
         if self.config is None:
             return np.zeros_like(positions)
         
         n = len(positions)
-        laplacian = np.roll(positions, -1, axis=0) - 2 * positions + np.roll(positions, 1, axis=0)
         scale_factor = (n / (2 * np.pi)) ** 2
-        
-        return self.config.coupling_constant * scale_factor * laplacian
+        c = self.params.coupling_constant * scale_factor
+
+        if _jit.NUMBA_AVAILABLE:
+            # Fused single-pass kernel writing into a per-size reusable
+            # buffer (loop sizes change on split/resample)
+            out = self._acc_bufs.get(n)
+            if out is None:
+                out = np.empty_like(positions)
+                self._acc_bufs[n] = out
+            _jit.laplacian_scaled(positions, out, c)
+            return out
+
+        laplacian = np.roll(positions, -1, axis=0) - 2 * positions + np.roll(positions, 1, axis=0)
+        return c * laplacian
 
     def _integrate_loop(self, loop: StringLoop, dt: float) -> None:
-        """Velocity Verlet integration for a single loop."""
-        # Half-step velocity
-        acc = self._compute_acceleration(loop.positions)
-        loop.velocities += 0.5 * acc * dt
-        
+        """
+        Velocity Verlet integration for a single loop.
+
+        a(t) is carried on the loop between steps, so each step evaluates
+        the force once (for a(t+dt)) instead of twice.
+        """
+        n = len(loop.positions)
+        c = self.params.coupling_constant * (n / (2 * np.pi)) ** 2
+
+        if loop.acc is None:
+            # Fresh loop (initial or post-split): bootstrap a(t)
+            loop.acc = np.empty_like(loop.positions)
+            loop.acc[:] = self._compute_acceleration(loop.positions)
+
+        if _jit.NUMBA_AVAILABLE:
+            _jit.verlet_step(loop.positions, loop.velocities, loop.acc, dt, c)
+            return
+
+        # Half-step velocity with carried acceleration
+        loop.velocities += 0.5 * loop.acc * dt
+
         # Full-step position
         loop.positions += loop.velocities * dt
-        
-        # Recalculate acceleration
-        acc_new = self._compute_acceleration(loop.positions)
-        
+
+        # Recalculate acceleration for the next step
+        loop.acc[:] = self._compute_acceleration(loop.positions)
+
         # Finish velocity update
-        loop.velocities += 0.5 * acc_new * dt
+        loop.velocities += 0.5 * loop.acc * dt
+
+    def _rebuild_batch(self) -> None:
+        """
+        Pack all loops into contiguous SoA blocks and rebind each loop's
+        arrays as views into them. One kernel call then integrates every
+        loop, instead of a Python-level dispatch per loop on arrays of a
+        few hundred points each.
+        """
+        total = sum(len(loop.positions) for loop in self.loops)
+        self._pos_all = np.empty((total, 3), dtype=np.float32)
+        self._vel_all = np.empty((total, 3), dtype=np.float32)
+        self._acc_all = np.empty((total, 3), dtype=np.float32)
+        self._offsets = np.zeros(len(self.loops) + 1, dtype=np.int64)
+
+        start = 0
+        for idx, loop in enumerate(self.loops):
+            end = start + len(loop.positions)
+            self._pos_all[start:end] = loop.positions
+            self._vel_all[start:end] = loop.velocities
+            loop.positions = self._pos_all[start:end]
+            loop.velocities = self._vel_all[start:end]
+            if loop.acc is not None:
+                self._acc_all[start:end] = loop.acc
+            else:
+                # Fresh loop (initial or post-split): bootstrap a(t)
+                self._acc_all[start:end] = self._compute_acceleration(loop.positions)
+            loop.acc = self._acc_all[start:end]
+            self._offsets[idx + 1] = end
+            start = end
+
+        self._batch_dirty = False
 
     def _check_self_intersection(self, loop: StringLoop) -> Optional[Tuple[int, int]]:
         """
-        Detect self-intersection using vectorized distance matrix.
+        Detect self-intersection using a KD-tree ball query.
         Returns (i, j) indices of colliding points, or None.
-        
+
+        Only pairs within INTERSECTION_THRESHOLD matter, so a spatial index
+        beats building (and masking) the full N x N distance matrix.
+
         Key constraint: Both daughter loops must be viable (>= MIN_LOOP_POINTS).
         """
         n = len(loop.positions)
         if n < self.MIN_LOOP_POINTS * 2:
             return None  # Too small to split meaningfully
-        
-        # Compute full distance matrix (vectorized, fast)
-        dists_sq = cdist(loop.positions, loop.positions, metric='sqeuclidean')
-        
-        threshold_sq = self.INTERSECTION_THRESHOLD ** 2
-        
-        # Minimum arc separation for viable daughters
-        # Both daughters need MIN_LOOP_POINTS, so we need |j-i| >= MIN_LOOP_POINTS
-        # AND n - |j-i| >= MIN_LOOP_POINTS
-        min_separation = self.MIN_LOOP_POINTS
-        
-        # Create mask to ignore:
-        # 1. Diagonal (self-distance)
-        # 2. Nearby neighbors (within min_separation for viable splits)
-        mask = np.ones((n, n), dtype=bool)
-        
-        for k in range(-min_separation, min_separation + 1):
-            indices = np.arange(n)
-            mask[indices, (indices + k) % n] = False
-        
-        # Also mask the "far side" that would make the other daughter too small
-        for k in range(n - min_separation + 1, n):
-            indices = np.arange(n)
-            mask[indices, (indices + k) % n] = False
-        
-        # Find collisions
-        collisions = (dists_sq < threshold_sq) & mask
-        
-        if not np.any(collisions):
+
+        # Cheap O(n) early-out: a loop whose bounding box is fat in every
+        # axis hasn't pinched, so no two distant-along-the-string points
+        # can be within the collision radius yet. Factor chosen
+        # conservatively (observed collisions happen below ~5x the
+        # threshold) so it only prunes the clearly-spread case.
+        span = loop.positions.max(axis=0) - loop.positions.min(axis=0)
+        if span.min() > self.INTERSECTION_THRESHOLD * 8:
+            return None
+
+        tree = cKDTree(loop.positions)
+        pairs = tree.query_pairs(r=self.INTERSECTION_THRESHOLD, output_type='ndarray')
+
+        if len(pairs) == 0:
+            return None
+
+        # Keep only pairs whose circular arc separation leaves both
+        # daughters viable (|j-i| and n-|j-i| both >= MIN_LOOP_POINTS)
+        d = pairs[:, 1] - pairs[:, 0]  # query_pairs guarantees i < j
+        arc = np.minimum(d, n - d)
+        pairs = pairs[arc >= self.MIN_LOOP_POINTS]
+
+        if len(pairs) == 0:
             return None
-        
-        # Get the closest collision pair
-        masked_dists = np.where(collisions, dists_sq, np.inf)
-        min_idx = np.unravel_index(np.argmin(masked_dists), masked_dists.shape)
-        
-        i, j = min_idx
-        if i > j:
-            i, j = j, i  # Ensure i < j
-        
-        return (i, j)
+
+        # Closest collision pair among the filtered candidates
+        diffs = loop.positions[pairs[:, 0]] - loop.positions[pairs[:, 1]]
+        dists_sq = np.einsum('ij,ij->i', diffs, diffs)
+        i, j = pairs[np.argmin(dists_sq)]
+
+        return (int(i), int(j))
 
     def _perform_split(self, loop: StringLoop, i: int, j: int) -> Tuple[Optional[StringLoop], Optional[StringLoop]]:
         """
@@ -163,34 +243,33 @@ class RelativisticString(PhysicsEngine):
         Returns two new daughter loops (or None if too small).
         """
         n = len(loop.positions)
-        
-        # Daughter 1: points from i to j (exclusive)
+
+        # Daughter index sequences. Fancy indexing with these is a single
+        # contiguous gather per array, replacing the chain of concatenate
+        # + copy calls whose outputs were immediately discarded by the
+        # resampling below anyway.
+        # Daughter 1: points from i to j; daughter 2: j to i (wrapping)
         if j > i:
-            pos1 = loop.positions[i:j+1].copy()
-            vel1 = loop.velocities[i:j+1].copy()
+            idx1 = np.arange(i, j + 1)
         else:
-            pos1 = np.concatenate([loop.positions[i:], loop.positions[:j+1]])
-            vel1 = np.concatenate([loop.velocities[i:], loop.velocities[:j+1]])
-        
-        # Daughter 2: points from j to i (wrapping around)
-        pos2 = np.concatenate([loop.positions[j:], loop.positions[:i+1]])
-        vel2 = np.concatenate([loop.velocities[j:], loop.velocities[:i+1]])
-        
+            idx1 = np.concatenate([np.arange(i, n), np.arange(0, j + 1)])
+        idx2 = np.concatenate([np.arange(j, n), np.arange(0, i + 1)])
+
         # Check minimum size
         loop1 = None
         loop2 = None
-        
-        if len(pos1) >= self.MIN_LOOP_POINTS:
+
+        if len(idx1) >= self.MIN_LOOP_POINTS:
             # Resample to uniform density
-            pos1, vel1 = self._resample_loop(pos1, vel1)
+            pos1, vel1 = self._resample_loop(loop.positions[idx1], loop.velocities[idx1])
             loop1 = StringLoop(positions=pos1, velocities=vel1, color_id=self.next_color_id)
             self.next_color_id += 1
-        
-        if len(pos2) >= self.MIN_LOOP_POINTS:
-            pos2, vel2 = self._resample_loop(pos2, vel2)
+
+        if len(idx2) >= self.MIN_LOOP_POINTS:
+            pos2, vel2 = self._resample_loop(loop.positions[idx2], loop.velocities[idx2])
             loop2 = StringLoop(positions=pos2, velocities=vel2, color_id=self.next_color_id)
             self.next_color_id += 1
-        
+
         return loop1, loop2
 
     def _resample_loop(self, positions: npt.NDArray, velocities: npt.NDArray, 
@@ -220,23 +299,25 @@ class RelativisticString(PhysicsEngine):
         cumulative[1:] = np.cumsum(segment_lengths)
         cumulative /= total_length
         
-        # Close the loop for interpolation
+        # Close the loop (y[0] == y[-1], required by the periodic spline)
         pos_closed = np.vstack([positions, positions[0:1]])
         vel_closed = np.vstack([velocities, velocities[0:1]])
-        
-        # Interpolate positions
+
+        # Interpolate all 3 dimensions in one vectorized call (axis=0).
+        # bc_type='periodic' matches the closed-loop topology: smooth
+        # across the seam, no extrapolation needed.
         new_params = np.linspace(0, 1, target_points, endpoint=False)
-        
-        new_positions = np.zeros((target_points, 3))
-        new_velocities = np.zeros((target_points, 3))
-        
-        for dim in range(3):
-            interp_pos = interp1d(cumulative, pos_closed[:, dim], kind='cubic', fill_value='extrapolate')
-            interp_vel = interp1d(cumulative, vel_closed[:, dim], kind='linear', fill_value='extrapolate')
-            new_positions[:, dim] = interp_pos(new_params)
-            new_velocities[:, dim] = interp_vel(new_params)
-        
-        return new_positions.astype(np.float64), new_velocities.astype(np.float64)
+        interp_pos = CubicSpline(cumulative, pos_closed, axis=0, bc_type='periodic')
+        new_positions = interp_pos(new_params)
+
+        # Velocities only need a linear resample: searchsorted + gather
+        # beats building an interp1d object per split
+        seg = np.searchsorted(cumulative, new_params, side='right') - 1
+        np.clip(seg, 0, n - 1, out=seg)
+        frac = (new_params - cumulative[seg]) / (cumulative[seg + 1] - cumulative[seg])
+        new_velocities = vel_closed[seg] + frac[:, None] * (vel_closed[seg + 1] - vel_closed[seg])
+
+        return new_positions.astype(np.float32), new_velocities.astype(np.float32)
 
     def step(self, dt: float) -> None:
         """
@@ -247,13 +328,27 @@ class RelativisticString(PhysicsEngine):
         """
         if not self.loops or self.config is None:
             return
-        
+
+        # Physics integration: one batched kernel call over all loops
+        # when compiled, otherwise per-loop NumPy
+        if _jit.NUMBA_AVAILABLE:
+            if self._batch_dirty:
+                self._rebuild_batch()
+            sizes = np.diff(self._offsets)
+            cs = self.params.coupling_constant * (sizes / (2 * np.pi)) ** 2
+            _jit.verlet_multi(self._pos_all, self._vel_all, self._acc_all,
+                              self._offsets, cs, dt)
+        else:
+            for loop in self.loops:
+                self._integrate_loop(loop, dt)
+
         new_loops: List[StringLoop] = []
-        
-        for loop in self.loops:
-            # Physics integration
-            self._integrate_loop(loop, dt)
-            
+
+        # One batched draw per step instead of a legacy global-state
+        # np.random.random() call per loop
+        rolls = self._rng.random(len(self.loops))
+
+        for idx, loop in enumerate(self.loops):
             # Check for topology change (splitting)
             if (self.config.splitting_enabled and 
                 len(self.loops) + len(new_loops) < self.MAX_LOOPS):
@@ -264,7 +359,7 @@ class RelativisticString(PhysicsEngine):
                     i, j = collision
                     
                     # Probabilistic split (controlled by coupling)
-                    if np.random.random() < self.config.splitting_probability:
+                    if rolls[idx] < self.config.splitting_probability:
                         daughter1, daughter2 = self._perform_split(loop, i, j)
                         
                         # Only commit split if at least one daughter is viable
@@ -275,47 +370,79 @@ class RelativisticString(PhysicsEngine):
                                 new_loops.append(daughter2)
                             
                             self.total_splits += 1
-                            print(f"✂️ STRING SPLIT! Now {len(new_loops)} loop(s)")
+                            self._batch_dirty = True  # Loop sizes changed
+                            # debug, not print: stdout flushes in the hot
+                            # step path get expensive under split storms
+                            logger.debug("String split! Now %d loop(s)", len(new_loops))
                             continue  # Don't add original loop
-            
+
             new_loops.append(loop)
-        
+
         self.loops = new_loops
 
+    def run(self, n_steps: int, dt: float) -> None:
+        """
+        Integrate n_steps in one go, skipping the per-step interaction
+        checks (no splitting). This is the fast path for long pure
+        integrations - benchmarks and conservation tests - where the
+        compiled kernel loops internally instead of paying n_steps
+        Python dispatches.
+        """
+        if not self.loops or self.config is None:
+            return
+
+        if _jit.NUMBA_AVAILABLE:
+            if self._batch_dirty:
+                self._rebuild_batch()
+            sizes = np.diff(self._offsets)
+            cs = self.params.coupling_constant * (sizes / (2 * np.pi)) ** 2
+            _jit.verlet_multi_run(self._pos_all, self._vel_all, self._acc_all,
+                                  self._offsets, cs, dt, n_steps)
+        else:
+            for _ in range(n_steps):
+                for loop in self.loops:
+                    self._integrate_loop(loop, dt)
+
+    @staticmethod
+    def _readonly_view(arr: npt.NDArray) -> npt.NDArray:
+        view = arr.view()
+        view.setflags(write=False)
+        return view
+
     def get_state(self) -> StringState:
         """Return state for rendering (multi-loop aware)."""
         if not self.loops:
             raise RuntimeError("Physics engine not initialized")
-        
-        # Primary loop for backward compatibility
-        primary = self.loops[0]
-        
+
         # Calculate total energy
         total_energy = 0.0
+        two_pi = 2 * np.pi
+        coupling = self.params.coupling_constant
         for loop in self.loops:
             n = len(loop.positions)
-            mass_per_point = (2 * np.pi) / n
-            ke = 0.5 * mass_per_point * np.sum(np.linalg.norm(loop.velocities, axis=1)**2)
-            
+            # Sum of squared magnitudes via einsum: no sqrt, no temporaries
+            ke = 0.5 * (two_pi / n) * np.einsum('ij,ij->', loop.velocities, loop.velocities)
+
             diffs = np.roll(loop.positions, -1, axis=0) - loop.positions
-            pe = 0.5 * self.config.coupling_constant * np.sum(np.linalg.norm(diffs, axis=1)**2) * (n / (2 * np.pi))
-            
+            pe = 0.5 * coupling * np.einsum('ij,ij->', diffs, diffs) * (n / two_pi)
+
             total_energy += ke + pe
         
-        # Create loop list for renderer
-        loop_copies = [
+        # Hand the renderer read-only views - it only reads them, and
+        # copying every loop each frame is O(total points) of pure memcpy
+        loop_views = [
             StringLoop(
-                positions=loop.positions.copy(),
-                velocities=loop.velocities.copy(),
+                positions=self._readonly_view(loop.positions),
+                velocities=self._readonly_view(loop.velocities),
                 color_id=loop.color_id
             )
             for loop in self.loops
         ]
-        
+
         return StringState(
-            positions=primary.positions.copy(),
-            velocities=primary.velocities.copy(),
+            positions=loop_views[0].positions,
+            velocities=loop_views[0].velocities,
             energy=total_energy,
-            loops=loop_copies,
+            loops=loop_views,
             num_loops=len(self.loops)
         )
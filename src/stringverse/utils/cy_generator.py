@@ -1,54 +1,116 @@
+import hashlib
+import logging
+from pathlib import Path
+
 import numpy as np
 import pyvista as pv
 from skimage import measure
 
+from stringverse.utils import _jit
+
+logger = logging.getLogger(__name__)
+
+
+def _compute_field(x: np.ndarray) -> np.ndarray:
+    """
+    Evaluate the scalar field whose zero level set is the rendered surface.
+
+    With Numba installed the 60^3 grid is evaluated by a parallel
+    compiled kernel (one prange axis, independent cells). The NumPy
+    fallback works on broadcast 1D axes instead of materializing three
+    meshgrid cubes, and reuses buffers in place: at resolution 60 the
+    meshgrid version churned through ~8 full 3D temporaries (30+ MB)
+    for a field that fits in one.
+    """
+    if _jit.NUMBA_AVAILABLE:
+        n = x.shape[0]
+        out = np.empty((n, n, n), dtype=x.dtype)
+        _jit.cy_field(x, out)
+        return out
+
+    X = x[:, None, None]
+    Y = x[None, :, None]
+    Z = x[None, None, :]
+
+    # Hopf-like normalization 1/sqrt(1 + r), built in place:
+    # the same buffer goes r^2 -> r -> 1/sqrt(1+r)
+    norm = X * X + Y * Y + Z * Z
+    norm += 0.1  # Regularization
+    np.sqrt(norm, out=norm)
+    norm += 1.0
+    np.sqrt(norm, out=norm)
+    np.reciprocal(norm, out=norm)
+
+    # Fermat quintic q = z1^5 + z2^5 + z3^5 with
+    # z1 = (X + iY)*norm, z2 = (Y + iZ)*norm, z3 = (Z + iX)*norm,
+    # expanded binomially in real arithmetic - complex128 temporaries
+    # cost twice the bandwidth and ** 5 hits cpow
+    re = np.zeros(np.broadcast_shapes(X.shape, Y.shape, Z.shape), dtype=x.dtype)
+    im = np.zeros_like(re)
+    for A, B in ((X, Y), (Y, Z), (Z, X)):
+        a = A * norm
+        b = B * norm
+        a2 = a * a
+        b2 = b * b
+        re += a * (a2 * a2 - 10.0 * a2 * b2 + 5.0 * b2 * b2)
+        im += b * (5.0 * a2 * a2 - 10.0 * a2 * b2 + b2 * b2)
+
+    # |q| - 0.5 + 0.3*cos(5*angle(q)), folding the phase structure into
+    # the magnitude isosurface. cos(5*angle) avoids atan2/cos entirely
+    # via the Chebyshev identity cos(5t) = 16c^5 - 20c^3 + 5c with
+    # c = Re(q)/|q|.
+    mag = np.sqrt(re * re + im * im)
+    c = np.ones_like(mag)  # angle(0) == 0 by convention
+    np.divide(re, mag, out=c, where=mag > 0.0)
+    c2 = c * c
+    field = mag
+    field -= 0.5
+    cos5 = ((16.0 * c2 - 20.0) * c2 + 5.0) * c
+    cos5 *= 0.3
+    field += cos5
+    return field
+
+
 def generate_calabi_yau_mesh(resolution: int = 60) -> pv.PolyData:
     """
     Generates a 3D mesh representing a slice of a Calabi-Yau manifold.
     Uses a projection of the Fermat quintic: z1^5 + z2^5 + z3^5 = 0
     with a more physically motivated parameterization.
     """
-    
-    # Define grid with higher resolution for smoother surface
+
+    # Define grid with higher resolution for smoother surface.
+    # float32 throughout: the surface is cosmetic, and single precision
+    # halves the 3D working set (field and intermediates inherit x's dtype)
     extent = 2.5
-    x = np.linspace(-extent, extent, resolution)
-    y = np.linspace(-extent, extent, resolution)
-    z = np.linspace(-extent, extent, resolution)
-    X, Y, Z = np.meshgrid(x, y, z)
-    
-    # Parameterize complex coordinates as projections
-    # Using a Hopf-like fibration mixing
-    r = np.sqrt(X**2 + Y**2 + Z**2 + 0.1)  # Regularization
-    
-    z1 = (X + 1j*Y) / np.sqrt(1 + r)
-    z2 = (Y + 1j*Z) / np.sqrt(1 + r)  
-    z3 = (Z + 1j*X) / np.sqrt(1 + r)
-    
-    # Fermat quintic: z1^5 + z2^5 + z3^5
-    quintic = z1**5 + z2**5 + z3**5
-    
-    # Use real and imaginary parts for the isosurface
-    # This creates the characteristic "folded" Calabi-Yau structure
-    scalar_field = np.abs(quintic) - 0.5
-    
-    # Also add structure from the phase
-    phase_field = np.cos(5 * np.angle(quintic))
-    
-    # Combine for richer geometry
-    combined_field = scalar_field + 0.3 * phase_field
-    
+    x = np.linspace(-extent, extent, resolution, dtype=np.float32)
+
+    # Field cache keyed by the generation parameters: re-runs at the
+    # same resolution skip the whole evaluation pass. (The renderer's
+    # .vtk mesh cache is separate; marching cubes itself is fast and
+    # stays on the hot path.)
+    key = hashlib.sha1(f"{resolution}-{extent}".encode()).hexdigest()
+    cache_file = Path.home() / ".cache" / "stringverse" / f"cy-{key}.npy"
+    if cache_file.exists():
+        combined_field = np.load(cache_file)
+    else:
+        combined_field = _compute_field(x)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_file, combined_field)
+        except OSError:
+            pass  # Read-only home: just skip caching
+
     try:
         verts, faces, normals, values = measure.marching_cubes(combined_field, level=0.0)
         
-        # Scale vertices back to coordinate space
+        # Scale vertices back to coordinate space (cubic grid: same
+        # spacing on every axis)
         dx = x[1] - x[0]
-        dy = y[1] - y[0]
-        dz = z[1] - z[0]
-        
+
         real_verts = np.zeros_like(verts)
         real_verts[:, 0] = x[0] + verts[:, 0] * dx
-        real_verts[:, 1] = y[0] + verts[:, 1] * dy
-        real_verts[:, 2] = z[0] + verts[:, 2] * dz
+        real_verts[:, 1] = x[0] + verts[:, 1] * dx
+        real_verts[:, 2] = x[0] + verts[:, 2] * dx
         
         # Create PyVista mesh
         faces_padded = np.hstack((np.full((faces.shape[0], 1), 3), faces))
@@ -60,10 +122,10 @@ def generate_calabi_yau_mesh(resolution: int = 60) -> pv.PolyData:
         return mesh
         
     except ImportError:
-        print("Scikit-image not installed. Returning sphere.")
+        logger.warning("Scikit-image not installed. Returning sphere.")
         return pv.Sphere()
     except Exception as e:
-        print(f"Error generating CY mesh: {e}. Returning sphere.")
+        logger.warning("Error generating CY mesh: %s. Returning sphere.", e)
         return pv.Sphere()
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
+import math
+import os
+
 import pyvista as pv
 import numpy as np
-import os
 from stringverse.core.interfaces import Renderer
 from stringverse.utils.cy_generator import generate_calabi_yau_mesh
 
@@ -20,6 +22,28 @@ class CalabiYauRenderer(Renderer):
         self.rotation_speed = 0.3  # Slower for better observation
         self.slice_position = 0.0  # Current slice position
         self.auto_slice = True  # Animate slice automatically
+        # Static height scalar ranges; the animation shifts the mapper's
+        # scalar range instead of rewriting the arrays (see update_actors)
+        self._height_range: tuple[float, float] | None = None
+        self._lod_height_range: tuple[float, float] | None = None
+        self._slice_actor = None
+        # Slice cache: rebuilt only when the slice position moves by more
+        # than a quantum, otherwise the cached slab just rides along with
+        # the rotation
+        self._last_slice_z: float | None = None
+        self._cached_slice: pv.DataSet | None = None
+        # PointSet clips/extracts far faster than PolyData (no cell
+        # traversal); needs VTK >= 9.1
+        self._use_pointset = tuple(pv.vtk_version_info) >= (9, 1)
+        # Level of detail: a decimated proxy carries the animated phases
+        # (auto-slice sweep); the full-res mesh is swapped in via actor
+        # visibility once the slice has been idle for a while
+        self._lod_mesh: pv.PolyData | None = None
+        self._main_actor = None
+        self._lod_actor = None
+        self._idle_frames = 0
+        self._lod_visible = True
+        self._dirty = True
 
     def setup_scene(self) -> None:
         self.plotter.set_background("black")
@@ -38,21 +62,47 @@ class CalabiYauRenderer(Renderer):
             print("Generating Calabi-Yau mesh (one-time)...")
             self.original_mesh = generate_calabi_yau_mesh(resolution=60)
             self.original_mesh.save(mesh_path)
-        
+
+        # Normals once, up front: the topology never changes, rotation
+        # transforms the active normals along with the points, and
+        # extraction propagates them - no per-frame normal filter needed
+        self.original_mesh = self.original_mesh.compute_normals()
+        # float32 point buffer: rotation and slab extraction are
+        # memory-bound, precision is cosmetic, and the per-frame uploads
+        # move half the bytes (disk-cached meshes may come back float64)
+        if self.original_mesh.points.dtype != np.float32:
+            self.original_mesh.points = self.original_mesh.points.astype(np.float32)
+
+        # Decimated LOD proxy (cached on disk alongside the full mesh)
+        lod_path = "calabi_yau_lod.vtk"
+        if os.path.exists(lod_path):
+            self._lod_mesh = pv.read(lod_path)
+        else:
+            self._lod_mesh = self.original_mesh.decimate(0.8).compute_normals()
+            self._lod_mesh.save(lod_path)
+        if self._lod_mesh.points.dtype != np.float32:
+            self._lod_mesh.points = self._lod_mesh.points.astype(np.float32)
+
         self.mesh = self.original_mesh.copy()
         
         # Compute mesh bounds for slicing
         self.bounds = self.mesh.bounds
         self.slice_range = (self.bounds[4], self.bounds[5])  # Z range
         
-        # Add curvature-based coloring
+        # Add curvature-based coloring. The scalars are uploaded exactly
+        # once: the phase animation only adds a uniform offset, which is
+        # applied by shifting the mapper's scalar range per frame instead
+        # of touching the array (see update_actors)
         if self.mesh.n_points > 0:
-            self.mesh = self.mesh.compute_normals()
-            z_coords = self.mesh.points[:, 2]
-            self.mesh.point_data["height"] = z_coords
-            
-        self.plotter.add_mesh(
-            self.mesh,
+            z0 = np.ascontiguousarray(self.mesh.points[:, 2], dtype=np.float32)
+            self.mesh.point_data["height"] = z0
+            self._height_range = (float(z0.min()), float(z0.max()))
+
+        lod_z0 = np.ascontiguousarray(self._lod_mesh.points[:, 2], dtype=np.float32)
+        self._lod_mesh.point_data["height"] = lod_z0
+        self._lod_height_range = (float(lod_z0.min()), float(lod_z0.max()))
+
+        surface_kwargs = dict(
             scalars="height",
             cmap="viridis",
             opacity=0.7,
@@ -62,9 +112,17 @@ class CalabiYauRenderer(Renderer):
             specular=0.5,
             specular_power=15,
             show_scalar_bar=False,
-            name="cy_actor"
         )
-        
+        self._main_actor = self.plotter.add_mesh(self.mesh, name="cy_actor", **surface_kwargs)
+        self._lod_actor = self.plotter.add_mesh(self._lod_mesh, name="cy_actor_lod", **surface_kwargs)
+
+        # Start on the LOD proxy: the auto-slice sweep counts as
+        # interaction until the user locks a slice position
+        self._main_actor.visibility = False
+        self._lod_actor.visibility = True
+        self._lod_visible = True
+        self._idle_frames = 0
+
         # Add slice plane indicator
         self._update_slice_plane()
         
@@ -73,6 +131,7 @@ class CalabiYauRenderer(Renderer):
             def update_slice(value):
                 self.slice_position = value
                 self.auto_slice = False  # Disable auto when user interacts
+                self._idle_frames = 0  # Interaction: drop to the LOD proxy
                 
             self.plotter.add_slider_widget(
                 update_slice,
@@ -105,45 +164,117 @@ class CalabiYauRenderer(Renderer):
         """Update the clipped mesh based on current slice position."""
         if self.original_mesh is None:
             return
-            
+
+        # Frame coherence: skip the whole extraction while the slice
+        # position stays within a small quantum of the last rebuild (the
+        # cached slab is rotated along with the mesh in update_actors)
+        quantum = 0.02 * (self.slice_range[1] - self.slice_range[0])
+        if (self._last_slice_z is not None
+                and abs(self.slice_position - self._last_slice_z) < quantum):
+            return
+
         # Clip mesh to show cross-section
         # Use a thin slab around the slice position
         slab_thickness = 0.5
         z_min = self.slice_position - slab_thickness
         z_max = self.slice_position + slab_thickness
-        
-        # Clip to slab
+
         try:
-            clipped = self.original_mesh.clip(normal='z', origin=(0, 0, z_min), invert=False)
-            clipped = clipped.clip(normal='z', origin=(0, 0, z_max), invert=True)
-            
-            if clipped.n_points > 0:
-                clipped = clipped.compute_normals()
-                clipped.point_data["height"] = clipped.points[:, 2]
-                
-                self.plotter.add_mesh(
-                    clipped,
-                    scalars="height",
-                    cmap="plasma",  # Different colormap for slice
-                    opacity=0.9,
-                    style='surface',
-                    show_edges=True,
-                    edge_color='white',
-                    smooth_shading=True,
-                    specular=0.8,
-                    specular_power=20,
-                    show_scalar_bar=False,
-                    name="cy_slice"
-                )
+            # Slab selection by Z mask: one NumPy sweep over the point
+            # array instead of two full VTK clip pipeline passes. (The
+            # mesh rotates every frame, so a presorted Z index would go
+            # stale - the mask is recomputed per rebuild.)
+            z = self.original_mesh.points[:, 2]
+            mask = (z >= z_min) & (z <= z_max)
+            self._last_slice_z = self.slice_position
+
+            if self._use_pointset:
+                # PointSet fast path (VTK >= 9.1): the cross-section only
+                # needs points for display, so skip cell traversal and
+                # surface extraction entirely
+                slab = pv.PointSet(self.original_mesh.points[mask])
+            else:
+                slab = self.original_mesh.extract_points(
+                    mask, adjacent_cells=True).extract_surface(algorithm='dataset_surface')
+            self._cached_slice = slab
+
+            if slab.n_points > 0:
+                # Normals are precomputed on original_mesh and propagate
+                # through extraction - no per-rebuild normal filter
+                slab.point_data["height"] = slab.points[:, 2].copy()
+
+                # The slab's topology changes with the slice position, so
+                # the mesh can't be updated in place - but the actor is
+                # reused by name, and hidden (not replaced) when the slab
+                # is empty
+                if self._use_pointset:
+                    self._slice_actor = self.plotter.add_mesh(
+                        slab,
+                        scalars="height",
+                        cmap="plasma",  # Different colormap for slice
+                        opacity=0.9,
+                        point_size=7,
+                        render_points_as_spheres=True,
+                        show_scalar_bar=False,
+                        name="cy_slice"
+                    )
+                else:
+                    self._slice_actor = self.plotter.add_mesh(
+                        slab,
+                        scalars="height",
+                        cmap="plasma",  # Different colormap for slice
+                        opacity=0.9,
+                        style='surface',
+                        show_edges=True,
+                        edge_color='white',
+                        smooth_shading=True,
+                        specular=0.8,
+                        specular_power=20,
+                        show_scalar_bar=False,
+                        name="cy_slice"
+                    )
+                self._slice_actor.visibility = True
+            elif self._slice_actor is not None:
+                self._slice_actor.visibility = False
         except Exception:
             pass  # Clipping can fail at boundaries
 
     def update_actors(self, state: any) -> None:
         if self.mesh:
+            # Frame coherence: nothing is moving (rotation off, slice
+            # parked within the rebuild quantum) and the full-res swap
+            # has already settled - the frame would be identical
+            quantum = 0.02 * (self.slice_range[1] - self.slice_range[0])
+            if (abs(self.rotation_speed) < 1e-9
+                    and not self.auto_slice
+                    and not self._lod_visible
+                    and self._last_slice_z is not None
+                    and abs(self.slice_position - self._last_slice_z) < quantum):
+                return
+            self._dirty = True
+
             # Slow rotation
             self.mesh.rotate_y(self.rotation_speed, inplace=True)
             if self.original_mesh:
                 self.original_mesh.rotate_y(self.rotation_speed, inplace=True)
+            if self._lod_mesh is not None:
+                self._lod_mesh.rotate_y(self.rotation_speed, inplace=True)
+            if self._cached_slice is not None:
+                # Keep the cached slab tracking the mesh between rebuilds
+                self._cached_slice.rotate_y(self.rotation_speed, inplace=True)
+
+            # LOD swap: the auto-slice sweep (or a recent slider move)
+            # counts as interaction; after 30 quiet frames the full-res
+            # mesh is swapped back in via actor visibility
+            if self.auto_slice:
+                self._idle_frames = 0
+            else:
+                self._idle_frames += 1
+            use_lod = self._idle_frames < 30
+            if use_lod != self._lod_visible:
+                self._lod_visible = use_lod
+                self._lod_actor.visibility = use_lod
+                self._main_actor.visibility = not use_lod
             
             self.time += 0.016
             
@@ -151,16 +282,26 @@ class CalabiYauRenderer(Renderer):
             if self.auto_slice:
                 amplitude = (self.slice_range[1] - self.slice_range[0]) * 0.4
                 center = (self.slice_range[0] + self.slice_range[1]) / 2
-                self.slice_position = center + amplitude * np.sin(self.time * 0.5)
+                self.slice_position = center + amplitude * math.sin(self.time * 0.5)
             
             # Update the slice visualization
             self._update_slice_plane()
             
-            # Update main mesh coloring
-            if "height" in self.mesh.point_data:
-                z_coords = self.mesh.points[:, 2]
-                phase = np.sin(self.time * 0.3)
-                self.mesh.point_data["height"] = z_coords + phase * 0.3
+            # Animate the surface coloring by shifting the visible
+            # mapper's scalar range: color(s, [lo - shift, hi - shift])
+            # is identical to writing s + shift against a fixed range,
+            # so the uniform phase costs two floats per frame instead of
+            # an N-sized scalar rewrite and re-upload
+            shift = math.sin(self.time * 0.3) * 0.3
+            if self._lod_visible:
+                lo, hi = self._lod_height_range
+                self._lod_actor.mapper.scalar_range = (lo - shift, hi - shift)
+            elif self._height_range is not None:
+                lo, hi = self._height_range
+                self._main_actor.mapper.scalar_range = (lo - shift, hi - shift)
 
     def render_frame(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty = False
         self.plotter.render()
@@ -1,7 +1,9 @@
 import numpy as np
 import pyvista as pv
+import vtk
 from stringverse.core.interfaces import Renderer
 from stringverse.core.models import MatrixState
+from stringverse.utils import _jit
 
 # Check GPU status for HUD display
 try:
@@ -21,10 +23,28 @@ class MatrixRenderer(Renderer):
     def __init__(self, interactive: bool = True) -> None:
         self.plotter = pv.Plotter(off_screen=not interactive)
         self.point_cloud: pv.PolyData | None = None
-        self.glyphs: pv.PolyData | None = None
         self.lines: pv.PolyData | None = None
         self.interactive = interactive
         self.connection_threshold = 0.1  # Minimum strength to draw connection
+        # Point-sprite splats draw one vertex per brane instead of a
+        # shaded sphere mesh; flip this off to get true spheres (proper
+        # silhouettes) for screenshots
+        self.use_point_sprites = True
+        # Persistent-actor state: meshes are mutated in place per frame
+        # instead of re-added (add_mesh rebuilds the mapper pipeline)
+        self._sphere = pv.Sphere(radius=0.2)  # Glyph template, built once
+        self._n_branes: int | None = None
+        self._brane_actor = None
+        self._brane_mapper = None
+        self._conn_actor = None
+        # Connection scratch, overallocated to all n*(n-1)/2 pairs once;
+        # each frame fills the first k rows in place
+        self._conn_cells: np.ndarray | None = None
+        self._conn_scalars: np.ndarray | None = None
+        # Frame coherence: last rendered eigenvalues; a frame within
+        # epsilon of them is skipped wholesale (paused/settled sim)
+        self._prev_eigs: np.ndarray | None = None
+        self._dirty = True
 
     def setup_scene(self) -> None:
         self.plotter.set_background("black")
@@ -34,26 +54,22 @@ class MatrixRenderer(Renderer):
         self.plotter.add_light(pv.Light(position=(-15, 10, -10), color='cyan', intensity=0.5))
         self.plotter.add_light(pv.Light(position=(0, -20, 10), color='orange', intensity=0.3))
         
-        # Initialize with dummy data
-        points = np.random.randn(10, 3) * 2
-        self.point_cloud = pv.PolyData(points)
-        
-        # Create spheres (small - branes are point-like)
-        sphere = pv.Sphere(radius=0.2)
-        self.glyphs = self.point_cloud.glyph(scale=False, orient=False, geom=sphere)
-        
-        self.plotter.add_mesh(
-            self.glyphs,
-            color="cyan",
-            specular=1.0,
-            specular_power=20,
-            ambient=0.3,
-            smooth_shading=True,
-            name="brane_actor"
-        )
-        
+        # Actors are created lazily on the first update_actors call,
+        # sized to the actual brane count; afterwards their meshes are
+        # only mutated in place
+        self.point_cloud = None
         self.lines = None
-        
+        self._n_branes = None
+
+        if _jit.NUMBA_AVAILABLE:
+            # Warm the connection-scan JIT so the first rendered frame
+            # doesn't stall on compilation; dtypes must match the real
+            # call (the engine's float32 strength pool) or numba just
+            # compiles a second specialization on frame one
+            _jit.build_connections_strength(
+                np.zeros((2, 2), dtype=np.float32), 0.0,
+                np.empty((1, 3), dtype=np.int64), np.empty(1, dtype=np.float32))
+
         self.plotter.show_axes()
         self.plotter.camera_position = 'iso'
         
@@ -71,75 +87,157 @@ class MatrixRenderer(Renderer):
             name='hud_text'
         )
 
-    def _create_connections_from_matrix(self, points: np.ndarray, 
-                                         strengths: np.ndarray) -> pv.PolyData:
+    def _connection_cells(self, strengths: np.ndarray) -> int:
+        """
+        Line connections based on off-diagonal matrix elements, written
+        into the persistent _conn_cells/_conn_scalars buffers; returns
+        the active count. This shows the EMERGENT GEOMETRY from
+        non-commutative matrices. Strong connections = open strings
+        stretched between D0-branes.
+        """
+        if _jit.NUMBA_AVAILABLE:
+            # Compiled single-pass scan: no index/mask temporaries at all
+            return _jit.build_connections_strength(
+                np.ascontiguousarray(strengths), self.connection_threshold,
+                self._conn_cells, self._conn_scalars)
+
+        # Vectorized upper-triangle scan: the old Python double loop made
+        # ~N^2/2 interpreter trips, one per brane pair
+        n = len(strengths)
+        iu, ju = np.triu_indices(n, k=1)
+        pair_strengths = strengths[iu, ju]
+        sel = pair_strengths > self.connection_threshold
+
+        k = int(sel.sum())
+        self._conn_cells[:k, 1] = iu[sel]
+        self._conn_cells[:k, 2] = ju[sel]
+        self._conn_scalars[:k] = pair_strengths[sel]
+        return k
+
+    def _build_actors(self, points: np.ndarray) -> None:
         """
-        Create line connections based on off-diagonal matrix elements.
-        This shows the EMERGENT GEOMETRY from non-commutative matrices.
-        Strong connections = open strings stretched between D0-branes.
+        Create the persistent brane/connection meshes and actors, sized
+        to the brane count. Called once (or if the count ever changes);
+        per-frame updates then mutate these meshes in place.
         """
         n = len(points)
-        lines = []
-        line_scalars = []
-        
-        for i in range(n):
-            for j in range(i + 1, n):
-                strength = strengths[i, j]
-                if strength > self.connection_threshold:
-                    lines.append([2, i, j])
-                    line_scalars.append(strength)
-        
-        if lines:
-            cells = np.array(lines).flatten()
-            mesh = pv.PolyData(points, lines=cells)
-            mesh.cell_data["strength"] = np.array(line_scalars)
-            return mesh
+        self._n_branes = n
+
+        self.point_cloud = pv.PolyData(points.copy())
+        self.point_cloud.point_data["clustering"] = np.zeros(n, dtype=np.float32)
+
+        if self.use_point_sprites:
+            # Gaussian splats: one vertex per brane instead of a shaded
+            # sphere mesh, the glow falls out of the splat shader for free
+            mapper = vtk.vtkPointGaussianMapper()
+            mapper.SetInputData(self.point_cloud)
+            mapper.SetScaleFactor(0.2)
+            mapper.SetEmissive(True)
+            mapper.SetSplatShaderCode(
+                "//VTK::Color::Impl\n"
+                "float dist2 = dot(offsetVCVSOutput.xy, offsetVCVSOutput.xy);\n"
+                "if (dist2 > 1.0) { discard; }\n"
+                "float glow = exp(-2.5 * dist2);\n"
+                "ambientColor *= glow;\n"
+                "diffuseColor *= glow;\n"
+            )
         else:
-            return pv.PolyData()
+            # vtkGlyph3DMapper instances the cached sphere template over
+            # the point cloud at render time: no n*sphere_verts glyph
+            # mesh to rebuild or recolor
+            mapper = vtk.vtkGlyph3DMapper()
+            mapper.SetSourceData(self._sphere)
+            mapper.SetInputData(self.point_cloud)
+            mapper.ScalingOff()
+        mapper.SetScalarModeToUsePointFieldData()
+        mapper.SelectColorArray("clustering")
+        mapper.SetColorModeToMapScalars()
+        mapper.SetLookupTable(pv.LookupTable(cmap="cool"))
+        self._brane_mapper = mapper
+
+        actor = vtk.vtkActor()
+        actor.SetMapper(mapper)
+        if not self.use_point_sprites:
+            prop = actor.GetProperty()
+            prop.SetSpecular(1.0)
+            prop.SetSpecularPower(20)
+            prop.SetAmbient(0.3)
+            prop.SetInterpolationToPhong()
+        # add_actor returns (actor, property)
+        self._brane_actor, _ = self.plotter.add_actor(actor, name="brane_actor")
+
+        # Connection lines share the brane points; cells are swapped per
+        # frame as the emergent geometry changes. The scratch buffers are
+        # sized for every pair up front so the per-frame scan never
+        # allocates; column 0 is the constant VTK cell size.
+        max_pairs = n * (n - 1) // 2
+        self._conn_cells = np.empty((max_pairs, 3), dtype=np.int64)
+        self._conn_cells[:, 0] = 2
+        self._conn_scalars = np.empty(max_pairs, dtype=np.float32)
+
+        # Placeholder degenerate line so the scalar array exists for
+        # add_mesh; real cells are swapped in on the first update
+        self.lines = pv.PolyData(points.copy(), lines=np.array([2, 0, 0]))
+        self.lines.cell_data["strength"] = np.zeros(1, dtype=np.float32)
+        self._conn_actor = self.plotter.add_mesh(
+            self.lines,
+            scalars="strength",
+            cmap="hot",  # Strong connections = bright
+            opacity=0.6,
+            line_width=3,
+            render_lines_as_tubes=True,
+            show_scalar_bar=False,
+            name="connection_actor",
+            reset_camera=False
+        )
+        self._conn_actor.visibility = False
 
     def update_actors(self, state: MatrixState) -> None:
-        if self.point_cloud is None:
+        # Cast once at the renderer boundary: VTK consumes float32
+        # natively, the extra float64 precision is invisible on screen,
+        # and every upload below moves half the bytes
+        points = np.ascontiguousarray(state.eigenvalues, dtype=np.float32)
+
+        # Frame coherence: branes haven't moved materially since the
+        # last rendered frame, so skip all mesh/VTK work
+        if (self._prev_eigs is not None
+                and points.shape == self._prev_eigs.shape
+                and np.max(np.abs(points - self._prev_eigs)) < 1e-6):
             return
+        self._dirty = True
 
-        points = state.eigenvalues
-        self.point_cloud.points = points
-        
-        # Create spheres
-        sphere = pv.Sphere(radius=0.2)
-        new_glyphs = self.point_cloud.glyph(scale=False, orient=False, geom=sphere)
-        
-        # Color by distance from center of mass (shows clustering)
+        if self._n_branes != len(points):
+            self._build_actors(points)
+            self._prev_eigs = points.copy()
+        else:
+            self._prev_eigs[:] = points
+
+        # Move the branes: splats/glyphs are generated at render time, so
+        # only the n point positions are touched
+        self.point_cloud.points[:] = points
+
+        # Color by distance from center of mass (shows clustering) -
+        # one scalar per brane, no per-vertex repeat
         center = np.mean(points, axis=0)
         distances = np.linalg.norm(points - center, axis=1)
-        glyph_colors = np.repeat(distances, sphere.n_points)
-        
-        self.plotter.add_mesh(
-            new_glyphs,
-            scalars=glyph_colors,
-            cmap="cool",
-            show_scalar_bar=False,
-            specular=1.0,
-            specular_power=20,
-            ambient=0.3,
-            smooth_shading=True,
-            name="brane_actor",
-            reset_camera=False
-        )
-        
-        # Draw connections based on off-diagonal matrix elements
+        self.point_cloud.point_data["clustering"][:] = distances
+        self._brane_mapper.SetScalarRange(float(distances.min()), float(distances.max()))
+
+        # Swap connection topology based on off-diagonal matrix elements
         if state.connection_strengths is not None:
-            connections = self._create_connections_from_matrix(points, state.connection_strengths)
-            if connections.n_points > 0:
-                self.plotter.add_mesh(
-                    connections,
-                    scalars="strength",
-                    cmap="hot",  # Strong connections = bright
-                    opacity=0.6,
-                    line_width=3,
-                    show_scalar_bar=False,
-                    name="connection_actor",
-                    reset_camera=False
-                )
+            k = self._connection_cells(state.connection_strengths)
+            if k > 0:
+                scalars = self._conn_scalars[:k]
+                self.lines.points[:] = points
+                self.lines.lines = self._conn_cells[:k].ravel()
+                self.lines.cell_data["strength"] = scalars
+                self._conn_actor.mapper.scalar_range = (float(scalars.min()), float(scalars.max()))
+                self._conn_actor.visibility = True
+            else:
+                self._conn_actor.visibility = False
 
     def render_frame(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty = False
         self.plotter.render()
@@ -2,6 +2,10 @@
 Multi-String Renderer with dynamic actor pool.
 Supports visualization of multiple string loops after splitting.
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 import pyvista as pv
 from typing import List, Optional
@@ -21,6 +25,32 @@ LOOP_COLORS = [
 ]
 
 
+@lru_cache(maxsize=8)
+def _periodic_spline_weights(n_ctrl: int, n_samples: int) -> np.ndarray:
+    """
+    Periodic Catmull-Rom resampling matrix W (n_samples, n_ctrl): smooth
+    closed-curve points are W @ control_points. The mapping only depends
+    on the two counts, so it is cached module-wide (shared across
+    renderer instances and thread-safe) and the per-frame spline becomes
+    a single small GEMM instead of a VTK parametric-spline pipeline run.
+    """
+    W = np.zeros((n_samples, n_ctrl), dtype=np.float32)
+    # Parameter sweep [0, n_ctrl]: the endpoint lands exactly on control
+    # point 0 again, closing the rendered curve
+    u = np.linspace(0.0, n_ctrl, n_samples)
+    i = np.minimum(np.floor(u).astype(np.int64), n_ctrl * 2 - 1)
+    f = (u - i).astype(np.float32)
+    f2 = f * f
+    f3 = f2 * f
+    rows = np.arange(n_samples)
+    # Catmull-Rom basis over the 4 neighbouring control points
+    np.add.at(W, (rows, (i - 1) % n_ctrl), 0.5 * (-f + 2 * f2 - f3))
+    np.add.at(W, (rows, i % n_ctrl), 0.5 * (2 - 5 * f2 + 3 * f3))
+    np.add.at(W, (rows, (i + 1) % n_ctrl), 0.5 * (f + 4 * f2 - 3 * f3))
+    np.add.at(W, (rows, (i + 2) % n_ctrl), 0.5 * (-f2 + f3))
+    return W
+
+
 class StringRenderer(Renderer):
     """
     Multi-String Renderer with dynamic actor pool.
@@ -32,18 +62,48 @@ class StringRenderer(Renderer):
     """
 
     MAX_LOOPS = 8  # Maximum renderable loops
-    SPLINE_POINTS = 200  # Points per spline (reduced for multi-loop perf)
+    SPLINE_POINTS = 200  # Default points per spline (reduced for multi-loop perf)
 
-    def __init__(self, interactive: bool = True) -> None:
+    def __init__(self, interactive: bool = True,
+                 spline_samples: Optional[int] = None) -> None:
         self.plotter = pv.Plotter(off_screen=not interactive)
         self.interactive = interactive
         self.active_loops = 0
-        
-        # Actor pool - pre-allocated meshes
+        # Rendered samples per loop. Every downstream cost (weight GEMMs,
+        # scalar buffers, GPU upload) scales with this, so coarse
+        # simulations can pass ~2-4x their control-point count instead of
+        # paying for the default. Uniform across loops: the pool meshes
+        # have fixed topology.
+        self.spline_samples = spline_samples or self.SPLINE_POINTS
+
+        # Actor pool - pre-allocated meshes and their actors. Meshes are
+        # mutated in place each frame; actors are toggled via visibility,
+        # never re-added (add_mesh per frame rebuilds the whole mapper
+        # pipeline).
         self.loop_meshes: List[Optional[pv.PolyData]] = [None] * self.MAX_LOOPS
+        self.loop_actors: List[Optional[pv.Actor]] = [None] * self.MAX_LOOPS
+        self._loop_counter_actor = None
+        # Per-slot output buffers for the resampled points/scalars.
+        # Worker threads write disjoint slots, so the compute half of a
+        # frame can run loops in parallel (BLAS/einsum release the GIL);
+        # only the VTK assignments stay on the main thread
+        self._pts_bufs = np.empty(
+            (self.MAX_LOOPS, self.spline_samples, 3), dtype=np.float32)
+        self._scalar_bufs = np.empty(
+            (self.MAX_LOOPS, self.spline_samples), dtype=np.float32)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Frame coherence: per-loop (positions, velocities) snapshots of
+        # the last rendered state; a frame within epsilon of it is
+        # skipped wholesale (paused sim, settled state)
+        self._prev_loops: List[tuple[np.ndarray, np.ndarray]] | None = None
+        self._dirty = True
 
     def setup_scene(self) -> None:
         """Initialize cameras, lights, and actor pool."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=min(self.MAX_LOOPS, os.cpu_count() or 1))
+
         self.plotter.set_background("black")
         
         # Dramatic lighting
@@ -51,29 +111,48 @@ class StringRenderer(Renderer):
         self.plotter.add_light(pv.Light(position=(-10, -10, 10), color='cyan', intensity=0.4))
         self.plotter.add_light(pv.Light(position=(0, 0, -15), color='magenta', intensity=0.3))
 
-        # Initialize actor pool with dummy geometry
+        # One vtkLookupTable per palette entry, resolved from matplotlib
+        # exactly once; every loop actor gets its table attached here and
+        # no cmap resolution ever happens again
+        self._luts = [pv.LookupTable(cmap=c, n_values=256) for c in LOOP_COLORS]
+        for lut in self._luts:
+            lut.scalar_range = (0.0, 255.0)
+
+        # Initialize actor pool with dummy geometry. Plain polylines, not
+        # pv.Spline: smoothing happens in the weight-matrix GEMM, so VTK
+        # only ever sees a fixed-topology line whose points mutate - no
+        # parametric-spline filter runs, at setup or per frame.
+        n = self.spline_samples
+        polyline_cell = np.concatenate(([n], np.arange(n)))
+        theta = np.linspace(0, 2 * np.pi, n, dtype=np.float32)
+        dummy_points = np.column_stack([
+            np.cos(theta), np.sin(theta), np.zeros_like(theta)
+        ])
         for i in range(self.MAX_LOOPS):
-            theta = np.linspace(0, 2 * np.pi, 50)
-            dummy_points = np.column_stack([
-                np.cos(theta), np.sin(theta), np.zeros_like(theta)
-            ])
-            dummy_points = np.vstack([dummy_points, dummy_points[0]])
-            
-            mesh = pv.Spline(dummy_points, self.SPLINE_POINTS)
+            # float32 buffers end to end: VTK consumes them natively, the
+            # precision is invisible on screen, and per-frame uploads move
+            # half the bytes
+            mesh = pv.PolyData(dummy_points.copy(), lines=polyline_cell)
+            # uint8 scalars: the 256-entry LUT can't resolve more than
+            # 256 levels anyway, and the per-frame upload drops to a
+            # quarter of the float32 size
+            mesh.point_data["speed"] = np.zeros(n, dtype=np.uint8)
             self.loop_meshes[i] = mesh
-            
-            # Add mesh but make it invisible initially (except first)
-            self.plotter.add_mesh(
+
+            # Add each mesh ONCE; per-frame updates mutate it in place
+            actor = self.plotter.add_mesh(
                 mesh,
-                scalars=np.zeros(self.SPLINE_POINTS),
-                cmap=LOOP_COLORS[i % len(LOOP_COLORS)],
+                scalars="speed",
+                cmap=self._luts[i % len(self._luts)],
                 line_width=6,
                 render_lines_as_tubes=True,
                 show_scalar_bar=False,
                 lighting=True,
-                opacity=1.0 if i == 0 else 0.0,  # Only first visible
+                clim=[0, 255],
                 name=f"string_loop_{i}"
             )
+            actor.visibility = i == 0  # Only first visible initially
+            self.loop_actors[i] = actor
         
         self.plotter.show_axes()
         self.plotter.camera_position = 'iso'
@@ -92,8 +171,9 @@ class StringRenderer(Renderer):
             name='hud_text'
         )
         
-        # Loop counter HUD
-        self.plotter.add_text(
+        # Loop counter HUD; the actor is kept so updates can mutate its
+        # string in place instead of re-creating a text actor + mapper
+        self._loop_counter_actor = self.plotter.add_text(
             "Loops: 1",
             position='upper_right',
             font_size=12,
@@ -101,87 +181,119 @@ class StringRenderer(Renderer):
             name='loop_counter'
         )
 
-    def _render_loop(self, loop: StringLoop, actor_index: int) -> None:
-        """Update a single loop's actor."""
-        if actor_index >= self.MAX_LOOPS:
-            return
-        
-        positions = loop.positions
-        velocities = loop.velocities
-        
-        # Close the loop
-        points_closed = np.vstack([positions, positions[0]])
-        
-        # Create spline
-        new_spline = pv.Spline(points_closed, self.SPLINE_POINTS)
-        
-        # Velocity-based coloring
-        vel_mag = np.linalg.norm(velocities, axis=1)
-        max_vel = max(np.max(vel_mag), 1.0)
-        vel_normalized = vel_mag / max_vel
-        vel_normalized = np.append(vel_normalized, vel_normalized[0])
-        
-        # Interpolate to spline
-        old_idx = np.linspace(0, 1, len(points_closed))
-        new_idx = np.linspace(0, 1, self.SPLINE_POINTS)
-        scalars = np.interp(new_idx, old_idx, vel_normalized)
-        
-        # Update actor
-        cmap = LOOP_COLORS[loop.color_id % len(LOOP_COLORS)]
-        
-        self.plotter.add_mesh(
-            new_spline,
-            scalars=scalars,
-            cmap=cmap,
-            line_width=6,
-            render_lines_as_tubes=True,
-            show_scalar_bar=False,
-            lighting=True,
-            clim=[0, 1],
-            opacity=1.0,
-            name=f"string_loop_{actor_index}",
-            reset_camera=False
-        )
+    def _compute_loop_arrays(self, loop: StringLoop, slot: int) -> None:
+        """
+        Resample one loop into its slot of the output buffers. Pure
+        NumPy on disjoint slots - safe to run from worker threads.
+        """
+        # No-op for the engine's own float32 state; anything else is cast
+        # once here so every downstream product (GEMM, scalars, upload)
+        # stays single precision
+        positions = np.asarray(loop.positions, dtype=np.float32)
+        velocities = np.asarray(loop.velocities, dtype=np.float32)
+
+        # Smooth the loop with the cached periodic resampling matrix:
+        # one small GEMM, no VTK spline filter, wrap handled by W itself
+        W = _periodic_spline_weights(len(positions), self.spline_samples)
+
+        # Velocity-based coloring, resampled with the same weights. One
+        # fused einsum pass gives |v|^2, sqrt/normalize run in place, and
+        # both GEMMs land in the slot buffers - no temporaries
+        v2 = np.einsum('ij,ij->i', velocities, velocities)
+        np.sqrt(v2, out=v2)
+        v2 /= max(v2.max(), 1.0)
+
+        np.matmul(W, positions, out=self._pts_bufs[slot])
+        scalars = self._scalar_bufs[slot]
+        np.matmul(W, v2, out=scalars)
+        np.clip(scalars, 0.0, 1.0, out=scalars)  # CR basis can overshoot
+        scalars *= 255.0  # quantized to uint8 during the VTK assignment
+
+    def _apply_loop(self, slot: int) -> None:
+        """Push a computed slot into its persistent mesh (main thread
+        only: VTK is not thread-safe)."""
+        mesh = self.loop_meshes[slot]
+        mesh.points[:] = self._pts_bufs[slot]
+        mesh.point_data["speed"][:] = self._scalar_bufs[slot]
+        self.loop_actors[slot].visibility = True
+
+    def _state_unchanged(self, loops: List[StringLoop], eps: float = 1e-6) -> bool:
+        """
+        True when every loop is within eps (L-inf) of the last rendered
+        snapshot - the whole frame can then be skipped. Also refreshes
+        the snapshot when the state did move.
+        """
+        prev = self._prev_loops
+        unchanged = prev is not None and len(prev) == len(loops)
+        if unchanged:
+            for (ppos, pvel), loop in zip(prev, loops):
+                if (ppos.shape != loop.positions.shape
+                        or np.max(np.abs(loop.positions - ppos)) > eps
+                        or np.max(np.abs(loop.velocities - pvel)) > eps):
+                    unchanged = False
+                    break
+        if not unchanged:
+            self._prev_loops = [
+                (loop.positions.copy(), loop.velocities.copy()) for loop in loops
+            ]
+        return unchanged
 
     def _hide_loop(self, actor_index: int) -> None:
         """Hide an unused loop actor."""
         if actor_index >= self.MAX_LOOPS:
             return
-        
-        # Create tiny invisible mesh
-        tiny = pv.Sphere(radius=0.001, center=(1000, 1000, 1000))
-        self.plotter.add_mesh(
-            tiny,
-            opacity=0.0,
-            name=f"string_loop_{actor_index}",
-            reset_camera=False
-        )
+
+        self.loop_actors[actor_index].visibility = False
 
     def update_actors(self, state: StringState) -> None:
         """Update all visible string loops."""
         # Multi-loop rendering
         if state.loops is not None:
+            # Frame coherence: nothing moved since the last rendered
+            # frame (paused sim), so skip all mesh/VTK work
+            if self._state_unchanged(state.loops):
+                return
+            self._dirty = True
+
             num_loops = len(state.loops)
-            
-            # Render active loops
-            for i, loop in enumerate(state.loops):
-                if i < self.MAX_LOOPS:
-                    self._render_loop(loop, i)
-            
+            active = min(num_loops, self.MAX_LOOPS)
+            loops = state.loops[:active]
+
+            # Compute phase: loops are independent, so fan out across
+            # the pool when there is more than one (a single loop isn't
+            # worth the dispatch overhead)
+            if active > 1:
+                futures = [
+                    self._pool.submit(self._compute_loop_arrays, loop, i)
+                    for i, loop in enumerate(loops)
+                ]
+                for future in futures:
+                    future.result()
+            else:
+                for i, loop in enumerate(loops):
+                    self._compute_loop_arrays(loop, i)
+
+            # Apply phase: VTK mesh mutation stays on the main thread
+            for i in range(active):
+                self._apply_loop(i)
+
             # Hide unused actors
             for i in range(num_loops, self.MAX_LOOPS):
                 self._hide_loop(i)
             
-            # Update counter HUD
+            # Update counter HUD by mutating the text actor in place
+            # (re-running add_text builds a fresh actor + mapper)
             if num_loops != self.active_loops:
                 self.active_loops = num_loops
-                self.plotter.add_text(
-                    f"Loops: {num_loops}",
-                    position='upper_right',
-                    font_size=12,
-                    color='cyan' if num_loops == 1 else 'yellow',
-                    name='loop_counter'
-                )
+                text = f"Loops: {num_loops}"
+                if hasattr(self._loop_counter_actor, 'SetInput'):
+                    self._loop_counter_actor.SetInput(text)
+                else:
+                    # Corner-positioned text comes back as a
+                    # vtkCornerAnnotation (UpperRight == 3)
+                    self._loop_counter_actor.SetText(3, text)
+                rgb = (0.0, 1.0, 1.0) if num_loops == 1 else (1.0, 1.0, 0.0)
+                self._loop_counter_actor.GetTextProperty().SetColor(*rgb)
         else:
             # Legacy single-loop fallback
             legacy_loop = StringLoop(
@@ -189,16 +301,95 @@ class StringRenderer(Renderer):
                 velocities=state.velocities,
                 color_id=0
             )
-            self._render_loop(legacy_loop, 0)
+            if self._state_unchanged([legacy_loop]):
+                return
+            self._dirty = True
+            self._compute_loop_arrays(legacy_loop, 0)
+            self._apply_loop(0)
             for i in range(1, self.MAX_LOOPS):
                 self._hide_loop(i)
 
-    def render_frame(self) -> None:
-        """Trigger a frame render."""
-        self.plotter.render()
+    def update_actors_batch(self, states: List[StringState]) -> None:
+        """
+        Render a pre-simulated sequence of states (offline playback).
+        When every frame shares the same loop layout, the resampling
+        GEMMs run once over the whole (frames, points) stack, amortizing
+        the Python/NumPy dispatch across the sequence; mixed layouts
+        fall back to the per-frame path.
+
+        Entries must own their arrays: the engine's get_state returns
+        live views into buffers that later steps overwrite, so collect
+        frames with StringState.copy(). Aliased input is rejected here
+        rather than silently rendered as F copies of the final frame.
+        """
+        if not states:
+            return
+
+        if len(states) > 1 and np.shares_memory(
+                states[0].positions, states[1].positions):
+            raise ValueError(
+                "states alias the engine's live buffers; snapshot each "
+                "frame with StringState.copy() when collecting the batch")
+
+        first = states[0].loops
+        uniform = first is not None and all(
+            s.loops is not None
+            and len(s.loops) == len(first)
+            and all(l.positions.shape == f.positions.shape
+                    for l, f in zip(s.loops, first))
+            for s in states[1:]
+        )
+        if not uniform:
+            for state in states:
+                self.update_actors(state)
+                self.render_frame()
+            return
+
+        active = min(len(first), self.MAX_LOOPS)
+
+        # One batched resample per slot: matmul broadcasts W over the
+        # frame axis, so the whole trajectory costs two GEMMs per loop
+        batch_pts = []
+        batch_scalars = []
+        for i in range(active):
+            W = _periodic_spline_weights(
+                first[i].positions.shape[0], self.spline_samples)
+            P = np.stack([np.asarray(s.loops[i].positions, dtype=np.float32)
+                          for s in states])
+            V = np.stack([np.asarray(s.loops[i].velocities, dtype=np.float32)
+                          for s in states])
+            v2 = np.einsum('fij,fij->fi', V, V)
+            np.sqrt(v2, out=v2)
+            v2 /= np.maximum(v2.max(axis=1, keepdims=True), 1.0)
+            batch_pts.append(np.matmul(W[None, :, :], P))   # (F, samples, 3)
+            batch_scalars.append(np.clip(v2 @ W.T, 0.0, 1.0) * 255.0)
+
+        for i in range(len(first), self.MAX_LOOPS):
+            self._hide_loop(i)
+
+        for f in range(len(states)):
+            for i in range(active):
+                mesh = self.loop_meshes[i]
+                mesh.points[:] = batch_pts[i][f]
+                mesh.point_data["speed"][:] = batch_scalars[i][f]
+                self.loop_actors[i].visibility = True
+            self._dirty = True
+            self.render_frame()
+
+        # Keep the coherence snapshot consistent with the last frame
+        self._state_unchanged(states[-1].loops)
 
     def render_frame(self) -> None:
-        """Trigger a frame render."""
-        # For interactive mode, we usually rely on the loop calling update(), 
-        # but explicitly calling render is good.
+        """Trigger a frame render (skipped when no actor changed)."""
+        if not self._dirty:
+            return
+        self._dirty = False
         self.plotter.render()
+
+    def close(self) -> None:
+        """Release renderer resources: stop the worker pool (its threads
+        outlive the renderer otherwise) and close the plotter window."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        self.plotter.close()
@@ -9,10 +9,15 @@ class TestMatrixPhysics(unittest.TestCase):
         engine = BFSSMatrixModel()
         engine.initialize(config)
         state = engine.get_state()
-        
+
+        # Raw matrices are not copied into the state unless requested
+        self.assertIsNone(state.matrices)
+        self.assertEqual(state.eigenvalues.shape, (10, 3))
+
+        engine.debug_state = True
+        state = engine.get_state()
         self.assertEqual(len(state.matrices), 3)
         self.assertEqual(state.matrices[0].shape, (10, 10))
-        self.assertEqual(state.eigenvalues.shape, (10, 3))
 
     def test_step_execution(self):
         config = SimulationConfig(resolution=5, time_step=0.01)
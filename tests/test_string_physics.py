@@ -25,10 +25,10 @@ class TestStringPhysics(unittest.TestCase):
         initial_state = engine.get_state()
         initial_energy = initial_state.energy
         
-        # Run 500 steps
-        for _ in range(500):
-            engine.step(config.time_step)
-            
+        # Run 500 steps through the compiled fast path (one kernel call,
+        # no per-step Python dispatch or split checks)
+        engine.run(500, config.time_step)
+
         final_energy = engine.get_state().energy
         
         # Check conservation within 1%